@@ -75,6 +75,14 @@ class Settings(BaseSettings):
     enable_cache: bool = Field(default=os.getenv("ENABLE_CACHE", "true").lower() == "true", env="ENABLE_CACHE")
     cache_ttl: int = Field(default=int(os.getenv("CACHE_TTL", "3600")), env="CACHE_TTL")
     
+    # Outbound HTTP client settings, shared by the OpenAI clients
+    http_max_connections: int = Field(default=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")), env="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "50")), env="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_keepalive_expiry: float = Field(default=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")), env="HTTP_KEEPALIVE_EXPIRY")
+    http_connect_timeout: float = Field(default=float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")), env="HTTP_CONNECT_TIMEOUT")
+    http_read_timeout: float = Field(default=float(os.getenv("HTTP_READ_TIMEOUT", "60")), env="HTTP_READ_TIMEOUT")
+    http_write_timeout: float = Field(default=float(os.getenv("HTTP_WRITE_TIMEOUT", "10")), env="HTTP_WRITE_TIMEOUT")
+    
     # API rate limits
     rate_limit_per_minute: int = Field(default=int(os.getenv("RATE_LIMIT_PER_MINUTE", "60")), env="RATE_LIMIT_PER_MINUTE")
     
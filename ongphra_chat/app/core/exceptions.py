@@ -25,6 +25,11 @@ class ResponseGenerationError(FortuneServiceException):
     pass
 
 
+class StreamInterruptedError(ResponseGenerationError):
+    """Exception raised when a streamed response stops before it is complete"""
+    pass
+
+
 class RepositoryError(FortuneServiceException):
     """Exception raised for errors in data access"""
     pass
@@ -1,9 +1,11 @@
 # app/core/logging.py
+import atexit
 import logging
 import os
+import queue
 import sys
 import stat
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from typing import Optional
 from pathlib import Path
 
@@ -59,19 +61,37 @@ class SafeRotatingFileHandler(RotatingFileHandler):
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-LOG_DIR = "logs"
+LOG_DIR = Path("logs")
 LOG_FILE = "app.log"
 MAX_LOG_SIZE = 10 * 1024 * 1024  # 10 MB
 BACKUP_COUNT = 5
 
-# Check if this is a worker process
-is_parent_process = os.environ.get("IS_PARENT_PROCESS", "true").lower() == "true"
+# Logger name prefixes that are quietened in worker processes
+WORKER_QUIET_PREFIXES = ("app.repository", "app.services")
+
+# Check if this is a worker process. Accept the usual boolean spellings so that
+# a value like "1" marks the parent instead of silently being treated as a worker.
+is_parent_process = os.environ.get("IS_PARENT_PROCESS", "true").strip().lower() in ("1", "true", "yes", "on")
 worker_id = os.getenv("WORKER_ID", "0")
 
+# Background listener that writes queued records to the console and log file
+_queue_listener: Optional[QueueListener] = None
+
+def _stop_queue_listener():
+    """Flush queued records and stop the background listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 def setup_logging():
     """Setup application logging"""
+    global _queue_listener
+    
     # Create logs directory if it doesn't exist
-    Path(LOG_DIR).mkdir(exist_ok=True)
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
     
     # Configure root logger
     root_logger = logging.getLogger()
@@ -87,10 +107,10 @@ def setup_logging():
             # Workers use higher level threshold to reduce noise
             root_logger.setLevel(logging.WARNING)
     
-    # Clear any existing handlers
-    if root_logger.handlers:
-        for handler in root_logger.handlers:
-            root_logger.removeHandler(handler)
+    # Clear any existing handlers (iterate over a copy, removing shrinks the list)
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    _stop_queue_listener()
     
     # Console handler with UTF-8 encoding
     console_handler = logging.StreamHandler(sys.stdout)
@@ -108,12 +128,10 @@ def setup_logging():
         if hasattr(sys.stdout, 'encoding'):
             sys.stdout.encoding = 'utf-8'
     
-    root_logger.addHandler(console_handler)
-    
     # File handler with rotation and UTF-8 encoding - only add in parent process
     # or with reduced logging level in workers
     file_handler = SafeRotatingFileHandler(
-        os.path.join(LOG_DIR, LOG_FILE),
+        LOG_DIR / LOG_FILE,
         maxBytes=MAX_LOG_SIZE,
         backupCount=BACKUP_COUNT,
         encoding='utf-8'  # Use UTF-8 encoding for log files
@@ -128,7 +146,12 @@ def setup_logging():
     if not is_parent_process:
         file_handler.setLevel(logging.WARNING)
     
-    root_logger.addHandler(file_handler)
+    # Log calls only enqueue the record; a listener thread does the console and file
+    # writes so logging from request handlers never blocks the event loop on disk I/O
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _queue_listener.start()
     
     # Set log levels for specific libraries
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -144,8 +167,7 @@ def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     
     # Set different level for repository loggers in worker processes
-    if not is_parent_process and (name.startswith("app.repository") or 
-                                 name.startswith("app.services")):
+    if not is_parent_process and name.startswith(WORKER_QUIET_PREFIXES):
         logger.setLevel(logging.WARNING)
     
     return logger
@@ -168,7 +190,7 @@ def get_logger_with_level(name: str, level: Optional[str] = None) -> logging.Log
         logger.setLevel(getattr(logging, level.upper()))
     elif not is_parent_process:
         # For worker processes, use higher threshold
-        if name.startswith("app.repository") or name.startswith("app.services"):
+        if name.startswith(WORKER_QUIET_PREFIXES):
             logger.setLevel(logging.WARNING)
     
     return logger 
\ No newline at end of file
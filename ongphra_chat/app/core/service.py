@@ -331,13 +331,13 @@ class FortuneService:
             
             # Check if the base name is valid
             if base_name not in mapped_bases:
-                valid_bases = ", ".join(list(mapped_bases.keys()))
+                valid_bases = ", ".join(mapped_bases)
                 raise FortuneServiceException(f"Invalid base name: {base_name}. Valid values are: {valid_bases}")
             
             # Check if the house name is valid
             base_data = mapped_bases[base_name]
             if "ภพ" not in base_data or house_name not in base_data["ภพ"]:
-                valid_houses = ", ".join(list(base_data["ภพ"].keys())) if "ภพ" in base_data else ""
+                valid_houses = ", ".join(base_data["ภพ"]) if "ภพ" in base_data else ""
                 raise FortuneServiceException(f"Invalid house name: {house_name}. Valid values are: {valid_houses}")
             
             # Get the house value
@@ -5,6 +5,11 @@ import sys
 import logging
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows; asyncio's loop is used instead
+    uvloop = None
+
 # Add parent directory to path for imports to work correctly
 parent_dir = str(Path(__file__).parent.parent.parent)
 if parent_dir not in sys.path:
@@ -42,9 +47,8 @@ async def run_migration():
         for sql_file in sql_files:
             logger.info(f"Processing migration: {sql_file.name}")
             
-            # Read SQL content
-            with open(sql_file, "r") as f:
-                sql_content = f.read()
+            # Read SQL content in a worker thread so the event loop is not blocked on disk I/O
+            sql_content = await asyncio.to_thread(sql_file.read_text)
             
             # Execute SQL statements
             try:
@@ -71,7 +75,8 @@ async def run_migration():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(run_migration())
+        run = uvloop.run if uvloop is not None else asyncio.run
+        run(run_migration())
     except KeyboardInterrupt:
         logger.info("Migration interrupted by user")
     except Exception as e:
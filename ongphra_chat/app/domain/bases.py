@@ -1,5 +1,5 @@
 # app/domain/bases.py
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from pydantic import BaseModel
 from app.domain.birth import BirthInfo
 
@@ -11,6 +11,11 @@ class Bases(BaseModel):
     base3: List[int]
     base4: List[int]
     
+    @property
+    def sequences(self) -> Tuple[List[int], List[int], List[int], List[int]]:
+        """The four base sequences in order, so base N is sequences[N - 1]"""
+        return (self.base1, self.base2, self.base3, self.base4)
+    
     def to_dict(self) -> Dict[str, List[int]]:
         """Convert to dictionary for API response"""
         return {
@@ -67,6 +67,7 @@ class Category(BaseModel):
     
     class Config:
         from_attributes = True
+        frozen = True
     
     @property
     def category_name(self) -> str:
@@ -84,6 +85,7 @@ class CategoryCombination(BaseModel):
     
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class Reading(BaseModel):
@@ -97,6 +99,7 @@ class Reading(BaseModel):
     
     class Config:
         from_attributes = True
+        frozen = True
     
     @property
     def content(self) -> str:
@@ -1,11 +1,12 @@
 # app/main.py
-from openai import AsyncOpenAI
 from fastapi import FastAPI, Request, Response, Depends, Query, APIRouter, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 import time
+import json
+import asyncio
 import logging
-import os
 import sys
 import uvicorn
 from datetime import datetime
@@ -18,8 +19,10 @@ from app.repository.reading_repository import ReadingRepository
 from app.repository.chat_repository import ChatRepository
 from app.services.reading_service import ReadingService, get_reading_service
 from app.services.chat_service import ChatService, get_chat_service
+from app.services.openai_service import OpenAIService
+from app.services.ai import close_openai_client, warm_openai_client
 from app.domain.meaning import Category, Reading
-from app.core.logging import setup_logging, get_logger
+from app.core.logging import setup_logging, get_logger, is_parent_process, worker_id
 from app.routers.api_router import router as api_router
 from app.routers.ai_tools_router import router as ai_tools_router
 from app.routers.chat_router import router as chat_router
@@ -54,10 +57,6 @@ The system integrates session management, fortune calculation, and dynamic promp
 for a comprehensive fortune telling experience.
 """
 
-# Determine if this is the main/parent process or a worker
-is_parent_process = os.environ.get("IS_PARENT_PROCESS", "true").lower() == "true"
-worker_id = os.getenv("WORKER_ID", "0")
-
 # Setup logging only once in the parent process
 if is_parent_process:
     # Initialize logging
@@ -69,12 +68,6 @@ logger = get_logger(__name__)
 # Initialize settings
 settings = get_settings()
 
-# Ensure logs directory exists - only in parent process to avoid race conditions
-if is_parent_process:
-    logs_dir = os.path.join(settings.base_dir, "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-    logger.debug("Logs directory created/verified")
-
 # Configure meaning service logger
 meaning_logger = logging.getLogger('app.services.meaning')
 if not meaning_logger.handlers:
@@ -86,33 +79,6 @@ if is_parent_process:
 else:
     logger.info(f"Worker {worker_id} starting up")
 
-# Try to import WeasyPrint for PDF generation
-_has_weasyprint = None
-def has_weasyprint():
-    global _has_weasyprint
-    if _has_weasyprint is None:
-        try:
-            from weasyprint import HTML
-            _has_weasyprint = True
-            if is_parent_process:
-                logger.info("WeasyPrint successfully imported for PDF generation")
-            else:
-                logger.debug("WeasyPrint imported in worker process")
-        except ImportError:
-            _has_weasyprint = False
-            if is_parent_process:
-                logger.warning("WeasyPrint not available. PDF export functionality will be disabled.")
-            else:
-                logger.debug("WeasyPrint not available in worker process")
-        except Exception as e:
-            _has_weasyprint = False
-            if is_parent_process:
-                logger.warning(f"Error importing WeasyPrint: {str(e)}. PDF export functionality will be disabled.")
-            else:
-                logger.debug(f"Error importing WeasyPrint in worker process: {str(e)}")
-    
-    return _has_weasyprint
-
 # Singleton app instance
 _app_instance = None
 
@@ -127,7 +93,9 @@ def create_application() -> FastAPI:
     app = FastAPI(
         title="Ongphra Chat API",
         description="API for fortune telling and chat with context memory",
-        version="1.0.0"
+        version="1.0.0",
+        # ORJSONResponse serializes API payloads faster than the stdlib encoder
+        default_response_class=ORJSONResponse
     )
     
     # Configure CORS
@@ -146,6 +114,10 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Compress larger JSON bodies; Starlette leaves text/event-stream responses uncompressed
+    # so streamed chat chunks are still flushed to the client as they are produced
+    app.add_middleware(GZipMiddleware, minimum_size=512)
+    
     # Add API router
     app.include_router(api_router)
     app.include_router(ai_tools_router)  # Add the AI tools router
@@ -170,6 +142,9 @@ _db_initialized = False
 _services = {}
 _repositories = {}
 
+# Keep references to fire-and-forget startup tasks so they are not garbage collected
+_background_tasks = set()
+
 # Register repositories and services for dependency injection
 @app.on_event("startup")
 async def startup_event():
@@ -195,6 +170,13 @@ async def startup_event():
             logger.info("Repositories initialized")
         else:
             logger.info(f"Worker {worker_id} repositories initialized")
+        
+        # Load the static categories table once so request handlers never wait on it
+        try:
+            category_count = await _repositories["category_repository"].load_name_index()
+            logger.info(f"Loaded {category_count} categories into the name index")
+        except Exception as e:
+            logger.warning(f"Could not preload categories, they will load on first use: {str(e)}")
     
     # Create services if not already created
     if not _services:
@@ -213,6 +195,12 @@ async def startup_event():
             logger.info("Services initialized")
         else:
             logger.info(f"Worker {worker_id} services initialized")
+        
+        # Open the OpenAI connection in the background so the first chat skips the handshake
+        if settings.openai_api_key:
+            task = asyncio.create_task(warm_openai_client())
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
 
 # Shutdown event to close database connections
 @app.on_event("shutdown")
@@ -223,6 +211,8 @@ async def shutdown_event():
         logger.info(f"Worker {worker_id} shutting down")
         
     await DatabaseManager.close_pool()
+    await OpenAIService.close_session()
+    await close_openai_client()
     
     if is_parent_process:
         logger.info("Database connections closed")
@@ -301,31 +291,34 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
+# The root and health payloads never change within a worker, so serialize them once
+_ROOT_BODY = json.dumps({
+    "message": "Welcome to Ongphra Chat API",
+    "version": "1.0.0",
+    "status": "online",
+    "docs_url": "/docs",
+    "worker_id": worker_id
+}).encode("utf-8")
+
+_HEALTH_BODY = json.dumps({
+    "status": "healthy",
+    "version": "1.0.0",
+    "worker_id": worker_id
+}).encode("utf-8")
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Welcome to Ongphra Chat API",
-        "version": "1.0.0",
-        "status": "online",
-        "docs_url": "/docs",
-        "worker_id": worker_id
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "worker_id": worker_id
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
-    # Check if WeasyPrint is available
-    has_weasyprint()
-    
     # Run the app directly if executed as a script
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
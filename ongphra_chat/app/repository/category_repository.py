@@ -1,4 +1,5 @@
 # app/repository/category_repository.py
+import time
 from typing import List, Optional, Dict, Any
 
 from app.repository.db_repository import DBRepository
@@ -9,33 +10,147 @@ from app.core.logging import get_logger
 class CategoryRepository(DBRepository[Category]):
     """Repository for categories"""
     
+    # The categories table is small reference data, so exact name lookups are
+    # served from an in-memory index shared by every repository instance
+    _name_index: Optional[Dict[str, Category]] = None
+    
+    # Thai meaning -> category, derived from the name index without another query
+    _thai_name_index: Optional[Dict[str, Category]] = None
+    
+    # Writes only clear the indexes in the worker that made them, so other workers
+    # reload theirs after this many seconds instead of serving stale categories forever
+    _NAME_INDEX_TTL_SECONDS = 600
+    _name_index_loaded_at: float = 0.0
+    
     def __init__(self, model_class=Category):
         """Initialize the category repository"""
         super().__init__(model_class, "categories")
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
         self.logger.info(f"Initialized CategoryRepository")
     
+    async def _get_name_index(self) -> Dict[str, Category]:
+        """Load the name index on first use, or once it has expired, with a single query"""
+        if (
+            CategoryRepository._name_index is not None
+            and time.monotonic() - CategoryRepository._name_index_loaded_at > CategoryRepository._NAME_INDEX_TTL_SECONDS
+        ):
+            CategoryRepository.clear_name_index()
+        if CategoryRepository._name_index is None:
+            categories = await self.get_all()
+            CategoryRepository._name_index = {category.name: category for category in categories}
+            CategoryRepository._name_index_loaded_at = time.monotonic()
+            self.logger.debug(f"Loaded {len(categories)} categories into the name index")
+        return CategoryRepository._name_index
+    
+    async def load_name_index(self) -> int:
+        """Load the name index ahead of the first lookup and return the number of categories"""
+        return len(await self._get_name_index())
+    
+    async def _get_thai_name_index(self) -> Dict[str, Category]:
+        """Build the Thai meaning index from the name index on first use"""
+        # Fetch the name index first so an expired one clears this index too
+        name_index = await self._get_name_index()
+        if CategoryRepository._thai_name_index is None:
+            thai_name_index: Dict[str, Category] = {}
+            for category in name_index.values():
+                # Keep the first category for a meaning, as the SQL lookup did
+                thai_name_index.setdefault(category.thai_meaning, category)
+            CategoryRepository._thai_name_index = thai_name_index
+        return CategoryRepository._thai_name_index
+    
+    @classmethod
+    def clear_name_index(cls) -> None:
+        """Drop the name indexes so they are reloaded on the next lookup"""
+        cls._name_index = None
+        cls._thai_name_index = None
+    
     async def get_by_name(self, name: str) -> Optional[Category]:
         """Get category by name"""
         self.logger.debug(f"Getting category by name: {name}")
         try:
+            name_index = await self._get_name_index()
+            category = name_index.get(name)
+            if category:
+                return category
+            
+            # Fall back to the database for rows added after the index was loaded
             query = "SELECT * FROM categories WHERE name = %s"
             result = await self.execute_raw_query(query, name)
             if result and len(result) > 0:
-                return self.model_class(**result[0])
+                category = self.model_class(**result[0])
+                name_index[name] = category
+                return category
             return None
         except Exception as e:
             self.logger.error(f"Error retrieving category by name {name}: {str(e)}", exc_info=True)
             raise
     
+    async def get_by_names(self, names: List[str]) -> Dict[str, Category]:
+        """
+        Get several categories by name, querying only names missing from the index
+        
+        Args:
+            names: Category names to look up
+            
+        Returns:
+            Dictionary mapping each found name to its category
+        """
+        if not names:
+            return {}
+        
+        unique_names = list(dict.fromkeys(names))
+        self.logger.debug(f"Getting {len(unique_names)} categories by name")
+        try:
+            name_index = await self._get_name_index()
+            found = {name: name_index[name] for name in unique_names if name in name_index}
+            missing = [name for name in unique_names if name not in found]
+            if missing:
+                placeholders = ", ".join(["%s"] * len(missing))
+                query = f"SELECT * FROM categories WHERE name IN ({placeholders})"
+                results = await self.execute_raw_query(query, *missing)
+                for row in results:
+                    category = self.model_class(**row)
+                    name_index[category.name] = category
+                    found[category.name] = category
+            return found
+        except Exception as e:
+            self.logger.error(f"Error retrieving categories by names {unique_names}: {str(e)}", exc_info=True)
+            raise
+    
+    async def create(self, entity: Category) -> Category:
+        """Create a category and invalidate the name index"""
+        result = await super().create(entity)
+        CategoryRepository.clear_name_index()
+        return result
+    
+    async def update(self, id: Any, entity: Category) -> Category:
+        """Update a category and invalidate the name index"""
+        result = await super().update(id, entity)
+        CategoryRepository.clear_name_index()
+        return result
+    
+    async def delete(self, id: Any) -> bool:
+        """Delete a category and invalidate the name index"""
+        result = await super().delete(id)
+        CategoryRepository.clear_name_index()
+        return result
+    
     async def get_by_thai_name(self, thai_name: str) -> Optional[Category]:
         """Get category by Thai meaning/name"""
         self.logger.debug(f"Getting category by Thai name: {thai_name}")
         try:
+            thai_name_index = await self._get_thai_name_index()
+            category = thai_name_index.get(thai_name)
+            if category:
+                return category
+            
+            # Fall back to the database for rows added after the index was loaded
             query = "SELECT * FROM categories WHERE thai_meaning = %s"
             result = await self.execute_raw_query(query, thai_name)
             if result and len(result) > 0:
-                return self.model_class(**result[0])
+                category = self.model_class(**result[0])
+                thai_name_index[thai_name] = category
+                return category
             return None
         except Exception as e:
             self.logger.error(f"Error retrieving category by Thai name {thai_name}: {str(e)}", exc_info=True)
@@ -130,6 +245,33 @@ class CategoryRepository(DBRepository[Category]):
             self.logger.error(f"Error retrieving combination by ID {combination_id}: {str(e)}", exc_info=True)
             raise
     
+    async def get_combinations_by_ids(self, combination_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get category combinations for several IDs in a single query
+        
+        Args:
+            combination_ids: Combination IDs to look up
+            
+        Returns:
+            Dictionary mapping each found combination ID to its row
+        """
+        if not combination_ids:
+            return {}
+        
+        unique_ids = list(dict.fromkeys(combination_ids))
+        placeholders = ", ".join(["%s"] * len(unique_ids))
+        self.logger.debug(f"Getting combinations by IDs: {unique_ids}")
+        try:
+            query = f"""
+                SELECT * FROM category_combinations 
+                WHERE id IN ({placeholders})
+            """
+            results = await self.execute_raw_query(query, *unique_ids)
+            return {row["id"]: row for row in results}
+        except Exception as e:
+            self.logger.error(f"Error retrieving combinations by IDs {unique_ids}: {str(e)}", exc_info=True)
+            raise
+    
     async def search_by_thai_meaning(self, keyword: str) -> List[Category]:
         """Search categories by Thai meaning containing the keyword"""
         self.logger.debug(f"Searching categories with Thai meaning containing: {keyword}")
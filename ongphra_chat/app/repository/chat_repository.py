@@ -1,13 +1,30 @@
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import uuid
 import json
 from datetime import datetime
 
+import orjson
+
 from app.repository.db_repository import DBRepository
 from app.domain.chat import ChatSession, ChatMessage
 from app.core.logging import get_logger
 
 
+def _dumps_metadata(data: Dict[str, Any]) -> str:
+    """Serialize metadata for a JSON column"""
+    return orjson.dumps(data).decode("utf-8")
+
+
+def _loads_metadata(raw: Any) -> Any:
+    """
+    Parse a metadata column
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to handle the stdlib exception.
+    """
+    return orjson.loads(raw)
+
+
 class ChatRepository:
     """Repository for chat sessions and messages"""
     
@@ -32,7 +49,7 @@ class ChatRepository:
         # Convert session data to JSON if provided
         metadata_json = None
         if session_data:
-            metadata_json = json.dumps(session_data)
+            metadata_json = _dumps_metadata(session_data)
         
         # Insert new session
         query = """
@@ -72,7 +89,7 @@ class ChatRepository:
         metadata_dict = None
         if session_data["metadata"]:
             try:
-                metadata_dict = json.loads(session_data["metadata"])
+                metadata_dict = _loads_metadata(session_data["metadata"])
             except json.JSONDecodeError:
                 self.logger.warning(f"Failed to parse session metadata JSON for session {session_id}")
         
@@ -120,7 +137,7 @@ class ChatRepository:
             metadata_dict = None
             if row["metadata"]:
                 try:
-                    metadata_dict = json.loads(row["metadata"])
+                    metadata_dict = _loads_metadata(row["metadata"])
                 except json.JSONDecodeError:
                     self.logger.warning(f"Failed to parse metadata JSON for session {row['id']}")
             
@@ -157,7 +174,7 @@ class ChatRepository:
         
         if session_data is not None:
             query_parts.append("metadata = %s")
-            params.append(json.dumps(session_data))
+            params.append(_dumps_metadata(session_data))
         
         # If nothing to update, return early
         if not query_parts:
@@ -196,7 +213,7 @@ class ChatRepository:
         # Convert metadata to JSON if provided
         metadata_json = None
         if metadata:
-            metadata_json = json.dumps(metadata)
+            metadata_json = _dumps_metadata(metadata)
         
         # Insert new message
         query = """
@@ -204,13 +221,11 @@ class ChatRepository:
             VALUES (%s, %s, %s, %s, %s, %s, %s)
         """
         
-        await self._execute_query(query, message_id, session_id, user_id, role, content, is_fortune, metadata_json)
-        
-        # Update session's updated_at timestamp
-        await self._execute_query(
-            "UPDATE chat_sessions SET updated_at = CURRENT_TIMESTAMP WHERE id = %s",
-            session_id
-        )
+        # Insert the message and touch the session's updated_at in one transaction
+        await self._execute_batch([
+            (query, (message_id, session_id, user_id, role, content, is_fortune, metadata_json)),
+            ("UPDATE chat_sessions SET updated_at = CURRENT_TIMESTAMP WHERE id = %s", (session_id,))
+        ])
         
         self.logger.info(f"Added {role} message to session {session_id}")
         
@@ -244,7 +259,7 @@ class ChatRepository:
             metadata_dict = None
             if row["metadata"]:
                 try:
-                    metadata_dict = json.loads(row["metadata"])
+                    metadata_dict = _loads_metadata(row["metadata"])
                 except json.JSONDecodeError:
                     self.logger.warning(f"Failed to parse metadata JSON for message {row['id']}")
             
@@ -299,6 +314,31 @@ class ChatRepository:
                     # For other queries, commit and return empty list
                     await conn.commit()
                     return []
+        except Exception as e:
+            self.logger.error(f"Database error: {str(e)}", exc_info=True)
+            raise e
+    
+    async def _execute_batch(self, statements: List[Tuple[str, tuple]]) -> None:
+        """
+        Execute several write statements on one connection and commit once
+        
+        Args:
+            statements: (query, args) pairs to execute in order
+        """
+        from app.config.database import DatabaseManager
+        
+        try:
+            async with await DatabaseManager.get_connection() as conn:
+                # The pool runs in autocommit mode, so open an explicit transaction
+                await conn.begin()
+                try:
+                    async with conn.cursor() as cursor:
+                        for query, args in statements:
+                            await cursor.execute(query, args)
+                    await conn.commit()
+                except BaseException:
+                    await conn.rollback()
+                    raise
         except Exception as e:
             self.logger.error(f"Database error: {str(e)}", exc_info=True)
             raise e 
\ No newline at end of file
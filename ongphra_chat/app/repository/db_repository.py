@@ -34,10 +34,11 @@ class DBRepository(BaseRepository[T]):
         except Exception as e:
             # Fallback to basic console logging if file logging fails
             self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
+            if not self.logger.handlers:
+                handler = logging.StreamHandler()
+                handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+                self.logger.addHandler(handler)
+                self.logger.setLevel(logging.INFO)
             self.logger.warning(f"Failed to initialize file logger: {str(e)}. Using console logger instead.")
             self.logger.info(f"Initialized DB repository for {model_class.__name__} with table: {table_name}")
     
@@ -133,7 +134,7 @@ class DBRepository(BaseRepository[T]):
         columns = list(data.keys())
         values = list(data.values())
         
-        set_clause = ", ".join([f"{col} = %s" for col in columns])
+        set_clause = ", ".join(f"{col} = %s" for col in columns)
         
         query = f"""
             UPDATE {self.table_name}
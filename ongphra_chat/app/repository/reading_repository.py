@@ -1,7 +1,8 @@
 # app/repository/reading_repository.py
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import logging
 import sys
+import time
 
 from app.repository.db_repository import DBRepository
 from app.domain.meaning import Reading
@@ -11,6 +12,12 @@ from app.core.logging import get_logger
 class ReadingRepository(DBRepository[Reading]):
     """Repository for readings"""
     
+    # Readings for a (base, position) pair are static reference data and there are only
+    # 4 x 7 pairs, so each pair's result is cached and shared by every repository instance.
+    # Entries hold the load time so writes made in other workers are picked up after the TTL.
+    _BASE_POSITION_CACHE_TTL_SECONDS = 600
+    _base_position_cache: Dict[Tuple[int, int], Tuple[List[Reading], float]] = {}
+    
     def __init__(self, model_class=Reading):
         """Initialize the reading repository"""
         super().__init__(model_class, "readings")
@@ -30,9 +37,38 @@ class ReadingRepository(DBRepository[Reading]):
             self.logger.warning(f"Failed to initialize file logger: {str(e)}. Using console logger instead.")
             self.logger.info(f"Initialized ReadingRepository")
     
+    @classmethod
+    def clear_base_position_cache(cls) -> None:
+        """Drop cached base/position readings so they are reloaded on the next lookup"""
+        cls._base_position_cache.clear()
+    
+    async def create(self, entity: Reading) -> Reading:
+        """Create a reading and invalidate the base/position cache"""
+        result = await super().create(entity)
+        ReadingRepository.clear_base_position_cache()
+        return result
+    
+    async def update(self, id: Any, entity: Reading) -> Reading:
+        """Update a reading and invalidate the base/position cache"""
+        result = await super().update(id, entity)
+        ReadingRepository.clear_base_position_cache()
+        return result
+    
+    async def delete(self, id: Any) -> bool:
+        """Delete a reading and invalidate the base/position cache"""
+        result = await super().delete(id)
+        ReadingRepository.clear_base_position_cache()
+        return result
+    
     async def get_by_base_and_position(self, base: int, position: int) -> List[Reading]:
         """Get readings by base and position"""
         self.logger.debug(f"Getting readings for base {base}, position {position}")
+        cached = ReadingRepository._base_position_cache.get((base, position))
+        if cached is not None:
+            cached_readings, loaded_at = cached
+            if time.monotonic() - loaded_at <= ReadingRepository._BASE_POSITION_CACHE_TTL_SECONDS:
+                # Return a copy so callers can extend or filter the list freely
+                return list(cached_readings)
         try:
             # Join with category_combinations to find the right readings
             # The base corresponds to house_number in the first category
@@ -49,7 +85,8 @@ class ReadingRepository(DBRepository[Reading]):
             results = await self.execute_raw_query(query, base, position)
             readings = [self.model_class(**row) for row in results]
             self.logger.debug(f"Found {len(readings)} readings for base {base}, position {position}")
-            return readings
+            ReadingRepository._base_position_cache[(base, position)] = (readings, time.monotonic())
+            return list(readings)
         except Exception as e:
             self.logger.error(f"Error retrieving readings for base {base}, position {position}: {str(e)}", exc_info=True)
             raise
@@ -87,6 +124,50 @@ class ReadingRepository(DBRepository[Reading]):
             self.logger.error(f"Error retrieving readings for category IDs {category_ids}: {str(e)}", exc_info=True)
             raise
     
+    async def get_grouped_by_categories(self, category_ids: List[int]) -> Dict[int, List[Reading]]:
+        """
+        Get readings for several categories in one query, grouped per category
+        
+        Args:
+            category_ids: Category IDs to look up
+            
+        Returns:
+            Dictionary mapping each category ID to the readings whose combination includes it,
+            in the same order get_by_categories would return them for that ID
+        """
+        if not category_ids:
+            return {}
+        
+        unique_ids = list(dict.fromkeys(category_ids))
+        placeholders = ", ".join(["%s"] * len(unique_ids))
+        self.logger.debug(f"Getting grouped readings for category IDs: {unique_ids}")
+        
+        try:
+            query = f"""
+                SELECT r.*, cc.category1_id, cc.category2_id, cc.category3_id
+                FROM readings r
+                JOIN category_combinations cc ON r.combination_id = cc.id
+                WHERE cc.category1_id IN ({placeholders})
+                   OR cc.category2_id IN ({placeholders})
+                   OR cc.category3_id IN ({placeholders})
+                ORDER BY r.id
+            """
+            results = await self.execute_raw_query(query, *(unique_ids * 3))
+            
+            requested = set(unique_ids)
+            grouped: Dict[int, List[Reading]] = {category_id: [] for category_id in unique_ids}
+            for row in results:
+                reading = self.model_class(**row)
+                matched_ids = {row["category1_id"], row["category2_id"], row["category3_id"]} & requested
+                for category_id in matched_ids:
+                    grouped[category_id].append(reading)
+            
+            self.logger.debug(f"Found {len(results)} readings for category IDs: {unique_ids}")
+            return grouped
+        except Exception as e:
+            self.logger.error(f"Error retrieving grouped readings for category IDs {unique_ids}: {str(e)}", exc_info=True)
+            raise
+    
     async def get_readings_by_combination(self, combination_id: int) -> List[Reading]:
         """Get readings by category combination ID"""
         self.logger.debug(f"Getting readings for combination ID: {combination_id}")
@@ -2,12 +2,11 @@
 from fastapi import APIRouter, Request, Depends, HTTPException, Header, Response
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
-import json
 import logging
 import asyncio
 
 from app.core.logging import get_logger
-from app.services.response import ResponseService  # Import ResponseService directly
+from app.services.response import get_response_service
 from app.services.calculator import CalculatorService  # Fix import path
 from app.services.reading_service import get_reading_service
 from app.core.dependencies import get_user_id
@@ -31,6 +30,15 @@ class FortuneResponse(BaseModel):
     extracted_birthdate: Optional[str] = Field(None, description="Extracted birthdate from message")
     error: Optional[str] = Field(None, description="Error message if any")
 
+class CalculatorRequest(BaseModel):
+    """Birth base calculator request model."""
+    birth_date: Optional[str] = Field(None, description="Birth date in YYYY-MM-DD format")
+
+class ReadingRequest(BaseModel):
+    """Fortune reading tool request model."""
+    birth_date: Optional[str] = Field(None, description="Birth date in YYYY-MM-DD format")
+    question: Optional[str] = Field("", description="User's question about their fortune")
+
 @router.post("/fortune", response_model=FortuneResponse)
 async def process_fortune_request(
     request: FortuneRequest,
@@ -52,8 +60,8 @@ async def process_fortune_request(
         # Use user_id from request if provided, otherwise from dependency
         user_identifier = request.user_id or user_id
         
-        # Create an instance of ResponseService
-        response_service = ResponseService()
+        # Reuse the shared ResponseService instance
+        response_service = get_response_service()
         
         # Process the fortune request using the integrated method in ResponseService
         result = await response_service.process_fortune_request(
@@ -79,7 +87,7 @@ async def process_fortune_request(
 
 @router.post("/calculator")
 async def calculator_tool(
-    request: Dict[str, Any],
+    request: CalculatorRequest,
     user_id: str = Depends(get_user_id)
 ) -> Dict[str, Any]:
     """
@@ -93,10 +101,10 @@ async def calculator_tool(
         Dictionary with calculation results
     """
     try:
-        logger.info(f"Processing calculator request with data: {json.dumps(request)}")
+        logger.info(f"Processing calculator request for birth_date={request.birth_date}")
         
         # Extract birth date parameters
-        birth_date_str = request.get("birth_date")
+        birth_date_str = request.birth_date
         if not birth_date_str:
             raise HTTPException(status_code=400, detail="Birth date is required")
         
@@ -117,7 +125,7 @@ async def calculator_tool(
     except Exception as e:
         logger.error(f"Error processing calculator request: {str(e)}", exc_info=True)
         return {
-            "birth_date": request.get("birth_date"),
+            "birth_date": request.birth_date,
             "base_number": None,
             "attributes": [],
             "error": str(e)
@@ -125,7 +133,7 @@ async def calculator_tool(
 
 @router.post("/reading")
 async def reading_tool(
-    request: Dict[str, Any],
+    request: ReadingRequest,
     user_id: str = Depends(get_user_id)
 ) -> Dict[str, Any]:
     """
@@ -139,11 +147,11 @@ async def reading_tool(
         Dictionary with fortune reading results
     """
     try:
-        logger.info(f"Processing reading request with data: {json.dumps(request)}")
+        logger.info(f"Processing reading request for birth_date={request.birth_date}")
         
         # Extract parameters
-        birth_date_str = request.get("birth_date")
-        question = request.get("question", "")
+        birth_date_str = request.birth_date
+        question = request.question or ""
         
         if not birth_date_str:
             raise HTTPException(status_code=400, detail="Birth date is required")
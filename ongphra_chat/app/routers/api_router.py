@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Path, Request
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from datetime import datetime
-from typing import Dict, Optional, List, Any
+from typing import AsyncGenerator, Dict, Optional, List, Any
+import asyncio
 import uuid
 import json
+import re
+from contextlib import aclosing
+from functools import lru_cache
 
 from app.core.logging import get_logger
+from app.core.exceptions import StreamInterruptedError
 from app.services.reading_service import ReadingService, get_reading_service
-from app.services.response import ResponseService
+from app.services.response import get_response_service
 from app.services.session_service import get_session_manager
 from app.services.chat_service import ChatService, get_chat_service
 from app.domain.meaning import FortuneReading
@@ -15,8 +21,196 @@ from app.domain.meaning import FortuneReading
 router = APIRouter(prefix="/api", tags=["API"])
 logger = get_logger(__name__)
 
-# Initialize ResponseService
-response_service = ResponseService()
+# Same shapes datetime.strptime accepts for "%Y-%m-%d"
+BIRTH_DATE_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+
+@lru_cache(maxsize=1024)
+def _parse_birth_date(value: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD birth date
+    
+    The format is checked with a regex and the datetime constructor validates the
+    ranges, which avoids strptime's format parsing. Results are memoized because the
+    same stored birth date is parsed again on every message in a session. Invalid
+    input raises ValueError and is not cached.
+    """
+    match = BIRTH_DATE_PATTERN.fullmatch(value)
+    if not match:
+        raise ValueError(f"Invalid birth date format: {value!r}, expected YYYY-MM-DD")
+    year, month, day = map(int, match.groups())
+    return datetime(year, month, day)
+
+
+# Streamed chunks are coalesced until this many characters are buffered
+# or the oldest buffered chunk has waited this long
+STREAM_BATCH_MAX_CHARS = 1024
+STREAM_BATCH_MAX_DELAY = 0.015
+
+# At most this many model chunks are buffered per streaming client; a client
+# that leaves the buffer full for longer than the timeout is treated as lagging
+STREAM_QUEUE_MAX_SIZE = 64
+STREAM_QUEUE_PUT_TIMEOUT = 2.0
+
+_STREAM_END = object()
+
+# Marker sent to the client once a streamed response is complete. It is stored as
+# UTF-8 bytes so StreamingResponse sends it without encoding it on every stream.
+STREAM_DONE_MARKER = b"[DONE]"
+
+# Marker sent instead of STREAM_DONE_MARKER when a streamed response is cut short
+STREAM_ERROR_MARKER = b"[ERROR]"
+
+# Maximum number of concurrent streaming responses per client address
+STREAM_MAX_CONCURRENT_PER_CLIENT = 8
+
+_active_streams: Dict[str, int] = {}
+
+
+def _acquire_stream_slot(client_host: str) -> bool:
+    """Reserve a streaming slot for a client address, returning False if it has none left"""
+    active = _active_streams.get(client_host, 0)
+    if active >= STREAM_MAX_CONCURRENT_PER_CLIENT:
+        return False
+    _active_streams[client_host] = active + 1
+    return True
+
+
+def _release_stream_slot(client_host: str) -> None:
+    """Return a streaming slot, dropping the entry once the client has none open"""
+    active = _active_streams.get(client_host, 0) - 1
+    if active > 0:
+        _active_streams[client_host] = active
+    else:
+        _active_streams.pop(client_host, None)
+
+
+async def _bounded_stream(
+    chunks: AsyncGenerator[str, None],
+    max_size: int = STREAM_QUEUE_MAX_SIZE,
+    put_timeout: float = STREAM_QUEUE_PUT_TIMEOUT
+) -> AsyncGenerator[str, None]:
+    """
+    Relay a chunk stream through a bounded queue
+    
+    The model stream is drained by a single producer task so that generation
+    is decoupled from socket writes, while the queue bound keeps memory per
+    connection fixed. If the client does not keep up, the stream is stopped
+    instead of blocking the producer indefinitely.
+    
+    Args:
+        chunks: Async generator of text chunks, closed when the relay stops
+        max_size: Maximum number of buffered chunks
+        put_timeout: Seconds to wait for buffer space before giving up
+        
+    Yields:
+        The chunks from the source iterator, in order
+        
+    Raises:
+        StreamInterruptedError: If the client lagged past the timeout or the
+            source iterator failed, so the chunks yielded so far are incomplete
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+    
+    async def produce():
+        try:
+            # Close the source as soon as the producer stops, so the model stream is
+            # not left open until garbage collection when the client goes away
+            async with aclosing(chunks):
+                async for chunk in chunks:
+                    try:
+                        await asyncio.wait_for(queue.put(chunk), timeout=put_timeout)
+                    except asyncio.TimeoutError:
+                        logger.warning(f"Streaming client lagging for more than {put_timeout}s, stopping stream")
+                        # The consumer has stopped draining and the reply is incomplete either
+                        # way, so drop the unread chunks to make room for the failure
+                        while not queue.empty():
+                            queue.get_nowait()
+                        queue.put_nowait(StreamInterruptedError(f"Client lagged for more than {put_timeout}s"))
+                        return
+        except Exception as e:
+            logger.error("Error while producing stream chunks: %s", e, exc_info=True)
+            await queue.put(StreamInterruptedError(f"Error while producing stream chunks: {str(e)}"))
+            return
+        
+        # Wait for space so no chunk the consumer has not read yet is dropped
+        await queue.put(_STREAM_END)
+    
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, StreamInterruptedError):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        # Wait for the producer to unwind so the source is closed before we return
+        await asyncio.wait({producer})
+
+
+async def _batch_chunks(
+    chunks: AsyncGenerator[str, None],
+    max_chars: int = STREAM_BATCH_MAX_CHARS,
+    max_delay: float = STREAM_BATCH_MAX_DELAY
+) -> AsyncGenerator[str, None]:
+    """
+    Coalesce small streamed chunks into larger writes
+    
+    Args:
+        chunks: Async generator of text chunks, closed when batching stops
+        max_chars: Flush once the buffer holds at least this many characters
+        max_delay: Flush once the oldest buffered chunk is this many seconds old
+        
+    Yields:
+        Concatenated chunks
+    """
+    loop = asyncio.get_running_loop()
+    iterator = chunks.__aiter__()
+    buffer: List[str] = []
+    size = 0
+    deadline = 0.0
+    pending = None
+    
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            
+            # Wait for the next chunk, but not past the flush deadline
+            timeout = max(0.0, deadline - loop.time()) if buffer else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                yield "".join(buffer)
+                buffer, size = [], 0
+                continue
+            
+            task, pending = pending, None
+            try:
+                chunk = task.result()
+            except StopAsyncIteration:
+                break
+            
+            if not buffer:
+                deadline = loop.time() + max_delay
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= max_chars:
+                yield "".join(buffer)
+                buffer, size = [], 0
+        
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            # Let the cancelled read unwind before closing the iterator it was reading
+            await asyncio.wait({pending})
+        # Close the source here rather than leaving it to garbage collection, so a
+        # closed batcher also stops the stream it was reading from
+        await iterator.aclose()
 
 @router.post("/fortune")
 async def get_fortune(
@@ -38,7 +232,7 @@ async def get_fortune(
         
         # Parse birth date
         try:
-            birth_date_obj = datetime.strptime(birth_date, "%Y-%m-%d")
+            birth_date_obj = _parse_birth_date(birth_date)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
         
@@ -100,7 +294,7 @@ async def get_chat_response(
         if birth_date:
             # New birth info provided, save it
             try:
-                birth_date_obj = datetime.strptime(birth_date, "%Y-%m-%d")
+                birth_date_obj = _parse_birth_date(birth_date)
                 session_manager.save_birth_info(user_id, birth_date_obj, thai_day)
                 has_birth_info = True
                 logger.info(f"Saved new birth info: {birth_date}, {thai_day}")
@@ -112,7 +306,7 @@ async def get_chat_response(
             birth_info = session_manager.get_birth_info(user_id)
             if birth_info:
                 try:
-                    birth_date_obj = datetime.strptime(birth_info["birth_date"], "%Y-%m-%d")
+                    birth_date_obj = _parse_birth_date(birth_info["birth_date"])
                     thai_day = birth_info["thai_day"]
                     has_birth_info = True
                     logger.info(f"Using stored birth info: {birth_date_obj.strftime('%Y-%m-%d')}, {thai_day}")
@@ -128,7 +322,7 @@ async def get_chat_response(
         )
         
         # Use the enhanced ResponseService with fortune processing if enabled
-        response_text = await response_service.generate_response(
+        response_text = await get_response_service().generate_response(
             prompt=prompt,
             language=language,
             has_birth_info=has_birth_info,
@@ -171,6 +365,7 @@ async def get_chat_response(
 
 @router.post("/chat/stream")
 async def stream_chat_response(
+    request: Request,
     prompt: str = Body(..., description="User's prompt or question"),
     birth_date: Optional[str] = Body(None, description="Birth date in YYYY-MM-DD format"),
     thai_day: Optional[str] = Body(None, description="Thai day of birth (optional, will be determined from birth date if not provided)"),
@@ -183,6 +378,20 @@ async def stream_chat_response(
     """Stream a chat response with context from previous conversations"""
     logger.info(f"Received streaming chat request with prompt: {prompt[:50]}...")
     
+    # Bound the number of open streams per client so one caller cannot tie up the workers
+    client_host = request.client.host if request.client else "unknown"
+    if not _acquire_stream_slot(client_host):
+        logger.warning(f"Rejecting streaming request from {client_host}: too many concurrent streams")
+        raise HTTPException(status_code=429, detail="Too many concurrent streaming requests")
+    
+    slot_released = False
+    
+    def release_slot():
+        nonlocal slot_released
+        if not slot_released:
+            slot_released = True
+            _release_stream_slot(client_host)
+    
     try:
         # Generate or use provided user_id
         if not user_id:
@@ -199,7 +408,7 @@ async def stream_chat_response(
         if birth_date:
             # New birth info provided, save it
             try:
-                birth_date_obj = datetime.strptime(birth_date, "%Y-%m-%d")
+                birth_date_obj = _parse_birth_date(birth_date)
                 session_manager.save_birth_info(user_id, birth_date_obj, thai_day)
                 has_birth_info = True
                 logger.info(f"Saved new birth info: {birth_date}, {thai_day}")
@@ -211,7 +420,7 @@ async def stream_chat_response(
             birth_info = session_manager.get_birth_info(user_id)
             if birth_info:
                 try:
-                    birth_date_obj = datetime.strptime(birth_info["birth_date"], "%Y-%m-%d")
+                    birth_date_obj = _parse_birth_date(birth_info["birth_date"])
                     thai_day = birth_info["thai_day"]
                     has_birth_info = True
                     logger.info(f"Using stored birth info: {birth_date_obj.strftime('%Y-%m-%d')}, {thai_day}")
@@ -227,7 +436,7 @@ async def stream_chat_response(
         )
                 
         # Get response generator from ResponseService
-        streaming_generator = await response_service.generate_response(
+        streaming_generator = await get_response_service().generate_response(
             prompt=prompt,
             language=language,
             has_birth_info=has_birth_info,
@@ -238,15 +447,26 @@ async def stream_chat_response(
         
         # Create a wrapper generator to save the full response
         async def stream_and_save():
-            full_response = ""
+            response_parts = []
             
-            # Stream the response chunks
-            async for chunk in streaming_generator:
-                # Add to full response
-                full_response += chunk
-                
-                # Yield the chunk to the client
-                yield chunk
+            try:
+                # Stream the response chunks, coalescing small ones into larger writes
+                async with aclosing(_batch_chunks(_bounded_stream(streaming_generator))) as chunks:
+                    async for chunk in chunks:
+                        # Add to full response
+                        response_parts.append(chunk)
+                        
+                        # Yield the chunk to the client
+                        yield chunk
+            except StreamInterruptedError as e:
+                # The reply is incomplete, so tell the client and keep it out of the history
+                logger.warning(f"Streaming response for user {user_id} was interrupted: {str(e)}")
+                yield STREAM_ERROR_MARKER
+                return
+            finally:
+                release_slot()
+            
+            full_response = "".join(response_parts)
             
             # After streaming completes, check if this was a fortune reading
             last_reading = session_manager.get_context_data(user_id, "last_reading")
@@ -270,14 +490,16 @@ async def stream_chat_response(
             )
             
             # Send end marker
-            yield "[DONE]"
+            yield STREAM_DONE_MARKER
         
         # Create a streaming response
         return StreamingResponse(
             stream_and_save(),
-            media_type="text/event-stream"
+            media_type="text/event-stream",
+            background=BackgroundTask(release_slot)
         )
     except Exception as e:
+        release_slot()
         logger.error(f"Error getting streaming chat response: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error getting streaming chat response: {str(e)}")
     
@@ -294,7 +516,7 @@ async def clear_session(
         memory_cleared = session_manager.clear_session(user_id)
         
         # Also clear from response service
-        response_service.clear_user_conversation(user_id)
+        get_response_service().clear_user_conversation(user_id)
         
         # Handle database session(s)
         db_cleared = False
@@ -373,7 +595,7 @@ async def get_enriched_birth_chart(
         
         # Parse birth date
         try:
-            birth_date_obj = datetime.strptime(birth_date, "%Y-%m-%d")
+            birth_date_obj = _parse_birth_date(birth_date)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
         
@@ -1,8 +1,68 @@
 from typing import Optional, Dict, Any
-from openai import AsyncOpenAI
+from functools import lru_cache
+import asyncio
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from app.config.settings import get_settings
 from app.core.logging import get_logger
 
+try:
+    import h2  # noqa: F401
+except ImportError:  # h2 is optional; the client falls back to HTTP/1.1 when it is missing
+    h2 = None
+
+
+@lru_cache()
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Get the process-wide OpenAI client so services share one connection pool
+    
+    When h2 is installed the pool negotiates HTTP/2, multiplexing concurrent
+    completions over a single connection to the API. Pool size and timeouts come
+    from settings so bursts of requests do not queue behind a small default pool
+    and a stalled connection cannot hold a request open indefinitely.
+    """
+    settings = get_settings()
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        http_client=DefaultAsyncHttpxClient(
+            http2=h2 is not None,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry
+            ),
+            timeout=httpx.Timeout(
+                connect=settings.http_connect_timeout,
+                read=settings.http_read_timeout,
+                write=settings.http_write_timeout,
+                pool=settings.http_connect_timeout
+            )
+        )
+    )
+
+
+async def warm_openai_client(timeout: float = 5.0) -> None:
+    """
+    Open a pooled connection to the OpenAI API ahead of the first completion
+    
+    Makes a cheap models request so the TCP and TLS handshakes are done before a
+    user is waiting on them. Failures are only logged; the first real request will
+    connect as usual.
+    """
+    try:
+        await asyncio.wait_for(get_openai_client().models.list(), timeout=timeout)
+    except Exception as e:
+        get_logger(__name__).debug(f"OpenAI connection warm-up skipped: {str(e)}")
+
+
+async def close_openai_client() -> None:
+    """Close the shared OpenAI client's connection pool if it was created"""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+        get_openai_client.cache_clear()
+
+
 class AIService:
     """Service for AI-based fortune reading generation"""
     
@@ -10,7 +70,7 @@ class AIService:
         """Initialize the AI service"""
         self.logger = get_logger(__name__)
         settings = get_settings()
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = get_openai_client()
         self.model = settings.default_model
         self.max_tokens = settings.ai_reading_max_tokens
         self.temperature = settings.ai_reading_temperature
@@ -1,9 +1,10 @@
 from typing import Dict, List, Optional, Any, Set, Tuple
 import time
 import hashlib
+import asyncio
 from pydantic import BaseModel, Field
 from app.core.logging import get_logger
-from app.config.settings import Settings
+from app.config.settings import get_settings
 from functools import lru_cache
 import re
 from datetime import datetime
@@ -15,6 +16,16 @@ from pythainlp.tokenize import word_tokenize
 from pythainlp.corpus import thai_stopwords
 from app.config.thai_astrology import CATEGORY_MAPPINGS, TOPIC_MAPPINGS
 
+# Keywords that indicate a general (non topic-specific) reading request
+GENERAL_READING_KEYWORDS = ['ทั่วไป', 'ดวงทั่วไป', 'ดูดวงทั่วไป', 'ทำนายทั่วไป', 'ทำนายดวง', 'ดูดวง', 'อนาคต', 'ชีวิต', 'ภาพรวม', 'general', 'overall', 'fortune', 'future', 'life']
+
+# Keywords that indicate the user asked about a specific topic
+SPECIFIC_TOPIC_KEYWORDS = ['การเงิน', 'เงินทอง', 'ความรัก', 'คู่ครอง', 'สุขภาพ', 'การงาน', 'งาน', 'การศึกษา', 'เรียน', 'ครอบครัว', 'ผลการเรียน', 'เดินทาง']
+
+# Each keyword list compiled into one alternation so a message is scanned once per list
+GENERAL_READING_PATTERN = re.compile("|".join(re.escape(k) for k in GENERAL_READING_KEYWORDS))
+SPECIFIC_TOPIC_PATTERN = re.compile("|".join(re.escape(k) for k in SPECIFIC_TOPIC_KEYWORDS))
+
 # Pydantic models for type safety and validation
 class CategoryMapping(BaseModel):
     thai_meaning: str
@@ -61,7 +72,7 @@ class AITopicService:
     def __init__(self):
         """Initialize the AI topic service with enhanced Thai language support"""
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
-        self.settings = Settings()
+        self.settings = get_settings()
         self.stopwords = thai_stopwords()
         
         # Initialize category mappings
@@ -77,10 +88,12 @@ class AITopicService:
         
         try:
             if hasattr(self.settings, 'redis_url'):
+                # Responses stay as bytes: cached results are parsed straight from them
                 self.redis = aioredis.from_url(
                     self.settings.redis_url,
                     encoding="utf-8",
-                    decode_responses=True
+                    socket_timeout=self.settings.redis_timeout,
+                    socket_connect_timeout=self.settings.redis_timeout
                 )
                 self.logger.info("Successfully connected to Redis")
             else:
@@ -115,7 +128,7 @@ class AITopicService:
                     cached_data = await self.redis.get(cache_key)
                     if cached_data:
                         self.logger.debug(f"Redis cache hit for key: {cache_key[:6]}...")
-                        return TopicDetectionResult.parse_raw(cached_data)
+                        return TopicDetectionResult.model_validate_json(cached_data)
                     
                     # Connection successful, reset failure flag
                     if self._redis_failed:
@@ -127,8 +140,8 @@ class AITopicService:
                 self.logger.error(f"Redis cache error: {str(e)}. Will retry in 5 minutes")
         
         # Fallback to memory cache
-        if cache_key in self._in_memory_cache:
-            cached_item = self._in_memory_cache[cache_key]
+        cached_item = self._in_memory_cache.get(cache_key)
+        if cached_item is not None:
             if time.time() - cached_item["timestamp"] < 86400:  # 24 hours
                 self.logger.debug(f"Memory cache hit for key: {cache_key[:6]}...")
                 return cached_item["data"]
@@ -311,17 +324,14 @@ class AITopicService:
             
         try:
             # First check for general reading requests
-            general_keywords = ['ทั่วไป', 'ดวงทั่วไป', 'ดูดวงทั่วไป', 'ทำนายทั่วไป', 'ทำนายดวง', 'ดูดวง', 'อนาคต', 'ชีวิต', 'ภาพรวม', 'general', 'overall', 'fortune', 'future', 'life']
-            
-            # Check for presence of general keywords
-            general_count = sum(1 for keyword in general_keywords if keyword.lower() in user_message.lower())
+            message_lower = user_message.lower()
             
-            # Check for absence of specific topics
-            specific_topics = ['การเงิน', 'เงินทอง', 'ความรัก', 'คู่ครอง', 'สุขภาพ', 'การงาน', 'งาน', 'การศึกษา', 'เรียน', 'ครอบครัว', 'ผลการเรียน', 'เดินทาง']
-            specific_count = sum(1 for topic in specific_topics if topic.lower() in user_message.lower())
+            # Check for presence of general keywords and absence of specific topics
+            has_general = GENERAL_READING_PATTERN.search(message_lower) is not None
+            has_specific = SPECIFIC_TOPIC_PATTERN.search(message_lower) is not None
             
             # If general indicators are present and specific topics are absent, it's likely a general request
-            if (general_count > 0 and specific_count == 0) or ("ทั่วไป" in user_message):
+            if (has_general and not has_specific) or ("ทั่วไป" in user_message):
                 self.logger.info("Detected general reading request")
                 return TopicDetectionResult(
                     primary_topic="ทั่วไป",
@@ -339,8 +349,8 @@ class AITopicService:
             if user_mappings:
                 mapping_analysis = self.analyze_user_mappings(user_mappings)
 
-            # Preprocess text
-            processed_text = self._preprocess_thai_text(user_message)
+            # Preprocess text off the event loop; pythainlp tokenization is CPU-bound and synchronous
+            processed_text = await asyncio.to_thread(self._preprocess_thai_text, user_message)
             message_lower = processed_text.lower()
             
             # Enhanced topic detection with hierarchical analysis
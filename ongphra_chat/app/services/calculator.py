@@ -1,4 +1,5 @@
 # app/services/calculator.py
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 
@@ -17,9 +18,16 @@ from app.config.thai_astrology import (
     BASE_TO_HOUSE_MAPPING
 )
 
+# Accepted Thai day names, joined once for the invalid-day error message
+VALID_THAI_DAYS = ", ".join(DAY_VALUES)
+
 class CalculatorService:
     """Service for calculating birth bases using the seven-nine method"""
     
+    # Bases depend only on (birth_date, thai_day), so results are shared by all instances
+    _BASES_CACHE_SIZE = 4096
+    _bases_cache: "OrderedDict[Tuple[datetime, str], BasesResult]" = OrderedDict()
+    
     def __init__(self):
         self.logger = get_logger(__name__)
         self.logger.info("Initializing CalculatorService")
@@ -80,7 +88,7 @@ class CalculatorService:
         """Calculate Base 1 sequence from Thai day"""
         if thai_day not in self.day_values:
             self.logger.error(f"Invalid Thai day: {thai_day}")
-            raise CalculationError(f"Invalid Thai day: {thai_day}. Valid values are: {', '.join(self.day_values.keys())}")
+            raise CalculationError(f"Invalid Thai day: {thai_day}. Valid values are: {VALID_THAI_DAYS}")
         
         day_index = self.day_values[thai_day]
         self.logger.debug(f"Calculating Base 1 for day: {thai_day} (index: {day_index})")
@@ -139,7 +147,7 @@ class CalculatorService:
             raise CalculationError("Birth date is required")
             
         if thai_day and thai_day not in self.day_values:
-            raise CalculationError(f"Invalid Thai day: {thai_day}. Valid values are: {', '.join(self.day_values.keys())}")
+            raise CalculationError(f"Invalid Thai day: {thai_day}. Valid values are: {VALID_THAI_DAYS}")
             
         year = birth_date.year
         if year < 1900 or year > 2100:
@@ -157,6 +165,14 @@ class CalculatorService:
                 thai_day = self.get_thai_day_from_date(birth_date)
                 self.logger.info(f"Thai day not provided, determined from date: {thai_day}")
             
+            # Return the cached result for a birth date we have already calculated
+            cache_key = (birth_date, thai_day)
+            cached_result = self._bases_cache.get(cache_key)
+            if cached_result is not None:
+                self._bases_cache.move_to_end(cache_key)
+                self.logger.debug(f"Using cached birth bases for: {birth_date.strftime('%Y-%m-%d')}, {thai_day}")
+                return cached_result
+            
             self.logger.info(f"Calculating birth bases for: {birth_date.strftime('%Y-%m-%d')}, {thai_day}")
             
             # Validate inputs
@@ -201,13 +217,20 @@ class CalculatorService:
                 base4=base4
             )
             
-            # Return combined result
-            self.logger.info(f"Successfully calculated bases for {birth_date.strftime('%Y-%m-%d')}")
-            return BasesResult(
+            result = BasesResult(
                 birth_info=birth_info,
                 bases=bases
             )
             
+            # Cache the result, evicting the least recently used entry when full
+            self._bases_cache[cache_key] = result
+            if len(self._bases_cache) > self._BASES_CACHE_SIZE:
+                self._bases_cache.popitem(last=False)
+            
+            # Return combined result
+            self.logger.info(f"Successfully calculated bases for {birth_date.strftime('%Y-%m-%d')}")
+            return result
+            
         except CalculationError as ce:
             self.logger.error(f"Calculation error: {str(ce)}")
             raise
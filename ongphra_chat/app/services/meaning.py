@@ -2,14 +2,14 @@
 from typing import Dict, List, Set, Optional, Any
 import re
 import json
+import asyncio
+import copy
 from datetime import datetime
 import hashlib
+import heapq
 import random
 import time
-import sys
-import os
-# Add the project root to the Python path, not the parent directory
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from dataclasses import dataclass
 
 from app.domain.bases import Bases, BasesResult
 from app.domain.meaning import Meaning, MeaningCollection, Category, Reading
@@ -18,9 +18,32 @@ from app.repository.reading_repository import ReadingRepository
 from app.core.exceptions import MeaningExtractionError
 from app.core.logging import get_logger
 from app.config.settings import get_settings
+from app.config.thai_astrology import DAY_LABELS, MONTH_LABELS, YEAR_LABELS, CATEGORY_MAPPINGS
 from app.services.ai_topic_service import get_ai_topic_service, UserMapping
 
 
+# House number (1-12) to base (1-4), three houses per base
+HOUSE_TO_BASE: Dict[int, int] = {house: (house - 1) // 3 + 1 for house in range(1, 13)}
+
+# Base values that carry extra weight when scoring general meanings
+SIGNIFICANT_VALUES = frozenset({1, 5, 7})
+
+# Thai heading for each base, used when a reading has no heading of its own
+BASE_HEADINGS: Dict[int, str] = {
+    1: "ฐานวันเกิด",
+    2: "ฐานเดือนเกิด",
+    3: "ฐานปีเกิด",
+    4: "ฐานรวม",
+}
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Cached value with the time it was stored"""
+    value: Any
+    timestamp: float
+
+
 class LRUCache:
     """
     Least Recently Used (LRU) cache implementation with size limiting and time-based expiration
@@ -47,7 +70,7 @@ class LRUCache:
         # Check for expiration
         item = self.cache[key]
         current_time = time.time()
-        if current_time - item["timestamp"] > self.ttl_seconds:
+        if current_time - item.timestamp > self.ttl_seconds:
             # Remove expired item
             self._remove_item(key)
             return None
@@ -55,7 +78,7 @@ class LRUCache:
         # Update access order
         self._update_access(key)
         
-        return item["value"]
+        return item.value
     
     def set(self, key, value):
         """Add item to cache, managing size limits"""
@@ -63,10 +86,7 @@ class LRUCache:
         
         # If key exists, update it
         if key in self.cache:
-            self.cache[key] = {
-                "value": value,
-                "timestamp": current_time
-            }
+            self.cache[key] = CacheEntry(value, current_time)
             self._update_access(key)
             return
             
@@ -75,10 +95,7 @@ class LRUCache:
             self._remove_lru()
             
         # Add new item
-        self.cache[key] = {
-            "value": value,
-            "timestamp": current_time
-        }
+        self.cache[key] = CacheEntry(value, current_time)
         self.access_order.append(key)
     
     def _update_access(self, key):
@@ -107,7 +124,7 @@ class LRUCache:
         current_time = time.time()
         expired_keys = [
             key for key, item in self.cache.items()
-            if current_time - item["timestamp"] > self.ttl_seconds
+            if current_time - item.timestamp > self.ttl_seconds
         ]
         
         for key in expired_keys:
@@ -131,6 +148,32 @@ class MeaningExtractor:
         self.reading_repository = reading_repository
         self.logger = logger
         
+    async def get_combination_categories(self, category1_id, category2_id, category3_id=None):
+        """Fetch the categories of a combination concurrently, with None for a missing third category"""
+        lookups = [
+            self.category_repository.get_by_id(category1_id),
+            self.category_repository.get_by_id(category2_id),
+        ]
+        if category3_id:
+            lookups.append(self.category_repository.get_by_id(category3_id))
+        
+        categories = await asyncio.gather(*lookups)
+        if len(categories) == 2:
+            return categories[0], categories[1], None
+        return tuple(categories)
+    
+    async def get_combinations_by_ids(self, combination_ids):
+        """
+        Fetch category combinations in one query, keyed by ID
+        
+        A failed lookup is logged and yields an empty result so callers skip the readings.
+        """
+        try:
+            return await self.category_repository.get_combinations_by_ids(combination_ids)
+        except Exception as e:
+            self.logger.error("Error retrieving combinations %s: %s", combination_ids, e)
+            return {}
+    
     async def extract_from_specific_combinations(self, combinations, bases):
         """Extract meanings from specific category combinations"""
         meanings = []
@@ -158,15 +201,13 @@ class MeaningExtractor:
                     category3_id = combination.get('category3_id', None)
                     
                     if not category1_id or not category2_id:
-                        self.logger.warning(f"Invalid combination data: {combination}")
+                        self.logger.warning("Invalid combination data: %s", combination)
                         continue
                     
-                    # Get the categories in this combination
-                    cat1 = await self.category_repository.get_by_id(category1_id)
-                    cat2 = await self.category_repository.get_by_id(category2_id)
-                    cat3 = None
-                    if category3_id:
-                        cat3 = await self.category_repository.get_by_id(category3_id)
+                    # Get the categories in this combination concurrently
+                    cat1, cat2, cat3 = await self.get_combination_categories(
+                        category1_id, category2_id, category3_id
+                    )
                     
                     # Determine base and position from categories
                     if cat1 and cat2:
@@ -175,7 +216,7 @@ class MeaningExtractor:
                             meanings.append(meaning)
             except Exception as inner_e:
                 # Log the error but continue processing other readings
-                self.logger.error(f"Error processing specific reading {reading.id if hasattr(reading, 'id') else 'unknown'}: {str(inner_e)}")
+                self.logger.error("Error processing specific reading %s: %s", reading.id if hasattr(reading, 'id') else 'unknown', inner_e)
                 continue
                 
         return meanings
@@ -194,11 +235,16 @@ class MeaningExtractor:
         regular_readings = await self.reading_repository.get_by_categories(category_ids)
         self.logger.info(f"Found {len(regular_readings)} relevant readings from regular categories")
         
+        # Fetch the combinations for all readings up front instead of one query at a time
+        combinations = await self.get_combinations_by_ids(
+            [reading.combination_id for reading in regular_readings]
+        )
+        
         # Convert regular readings to meanings
         for reading in regular_readings:
             try:
                 # Get the combination to determine which bases and positions to use
-                combination = await self.category_repository.get_combination_by_id(reading.combination_id)
+                combination = combinations.get(reading.combination_id)
                 if combination:
                     # Handle both dictionary and object access patterns
                     category1_id = combination.category1_id if hasattr(combination, 'category1_id') else combination.get('category1_id')
@@ -206,15 +252,13 @@ class MeaningExtractor:
                     category3_id = combination.category3_id if hasattr(combination, 'category3_id') else combination.get('category3_id', None)
                     
                     if not category1_id or not category2_id:
-                        self.logger.warning(f"Invalid combination data: {combination}")
+                        self.logger.warning("Invalid combination data: %s", combination)
                         continue
                     
-                    # Get the categories in this combination
-                    cat1 = await self.category_repository.get_by_id(category1_id)
-                    cat2 = await self.category_repository.get_by_id(category2_id)
-                    cat3 = None
-                    if category3_id:
-                        cat3 = await self.category_repository.get_by_id(category3_id)
+                    # Get the categories in this combination concurrently
+                    cat1, cat2, cat3 = await self.get_combination_categories(
+                        category1_id, category2_id, category3_id
+                    )
                     
                     # Create meaning
                     meaning = await self._create_meaning_from_categories(cat1, cat2, cat3, bases, reading, 5.0)
@@ -222,7 +266,7 @@ class MeaningExtractor:
                         meanings.append(meaning)
             except Exception as inner_e:
                 # Log the error but continue processing other readings
-                self.logger.error(f"Error processing regular reading {reading.id if hasattr(reading, 'id') else 'unknown'}: {str(inner_e)}")
+                self.logger.error("Error processing regular reading %s: %s", reading.id if hasattr(reading, 'id') else 'unknown', inner_e)
                 continue
                 
         return meanings
@@ -262,16 +306,7 @@ class MeaningExtractor:
         # Houses 4-6 -> Base 2
         # Houses 7-9 -> Base 3
         # Houses 10-12 -> Base 4
-        if 1 <= house_number <= 3:
-            return 1
-        elif 4 <= house_number <= 6:
-            return 2
-        elif 7 <= house_number <= 9:
-            return 3
-        elif 10 <= house_number <= 12:
-            return 4
-        else:
-            return 1  # Default to base 1
+        return HOUSE_TO_BASE.get(house_number, 1)  # Default to base 1
     
     def _get_position_for_house_number(self, house_number: int) -> int:
         """Map house number to position (1-7)"""
@@ -285,6 +320,15 @@ class MeaningExtractor:
 class MeaningService:
     """Service for extracting meanings based on bases and question"""
     
+    # General meanings depend only on the base values, and a new MeaningService is
+    # created per request, so the cache is shared at class level. Callers get their
+    # own copy so one request cannot change what another is served.
+    _bases_meaning_cache = LRUCache(max_size=2000, ttl_seconds=600)  # 10 minute TTL
+    
+    # Birth charts requested without a question depend only on the birth date and day.
+    # Charts are plain dicts, so they are deep-copied in and out like the bases cache.
+    _birth_chart_cache = LRUCache(max_size=2000, ttl_seconds=600)  # 10 minute TTL
+    
     def __init__(
         self,
         category_repository: CategoryRepository,
@@ -305,46 +349,11 @@ class MeaningService:
         # Initialize extractor helper
         self.extractor = MeaningExtractor(category_repository, reading_repository, self.logger)
         
-        # Initialize Thai position labels from calculator
-        try:
-            from app.services.calculator import CalculatorService
-            calculator = CalculatorService()
-            self.day_labels = calculator.day_labels
-            self.month_labels = calculator.month_labels
-            self.year_labels = calculator.year_labels
-            self.logger.debug(f"Initialized Thai position labels from calculator: " +
-                             f"day={self.day_labels}, month={self.month_labels}, year={self.year_labels}")
-        except Exception as e:
-            self.logger.warning(f"Failed to initialize labels from calculator: {str(e)}. Using defaults.")
-            # Fallback to default labels if calculator import fails
-            self.day_labels = ["อัตตะ", "หินะ", "ธานัง", "ปิตา", "มาตา", "โภคา", "มัชฌิมา"]
-            self.month_labels = ["ตะนุ", "กดุมภะ", "สหัชชะ", "พันธุ", "ปุตตะ", "อริ", "ปัตนิ"],
-            self.year_labels = ["มรณะ", "สุภะ", "กัมมะ", "ลาภะ", "พยายะ", "ทาสา", "ทาสี"]
-        
-        # Initialize category mappings for house numbers and meanings
-        self.CATEGORY_MAPPINGS = {
-            'กดุมภะ': {'thai_meaning': 'รายได้รายจ่าย', 'house_number': 1, 'house_type': 'กาลปักษ์'},
-            'กัมมะ': {'thai_meaning': 'หน้าที่การงาน', 'house_number': 2, 'house_type': 'เกณฑ์ชะตา'},
-            'ตะนุ': {'thai_meaning': 'ตัวท่านเอง', 'house_number': 3, 'house_type': 'จร'},
-            'ทาสา': {'thai_meaning': 'เหน็จเหนื่อยเพื่อคนอื่น ส่วนรวม', 'house_number': 4, 'house_type': 'กาลปักษ์'},
-            'ทาสี': {'thai_meaning': 'การเหน็จเหนื่อยเพื่อตัวเอง', 'house_number': 5, 'house_type': 'เกณฑ์ชะตา'},
-            'ธานัง': {'thai_meaning': 'เรื่องเงิน ๆ ทอง ๆ', 'house_number': 6, 'house_type': 'จร'},
-            'ปัตนิ': {'thai_meaning': 'คู่ครอง', 'house_number': 7, 'house_type': 'กาลปักษ์'},
-            'ปิตา': {'thai_meaning': 'พ่อหรือผู้ใหญ่ เรื่องนอกบ้าน', 'house_number': 8, 'house_type': 'เกณฑ์ชะตา'},
-            'ปุตตะ': {'thai_meaning': 'เรื่องลูก การเริ่มต้น', 'house_number': 9, 'house_type': 'จร'},
-            'พยายะ': {'thai_meaning': 'สิ่งไม่ดี เรื่องปิดบัง ซ่อนเร้น', 'house_number': 10, 'house_type': 'กาลปักษ์'},
-            'พันธุ': {'thai_meaning': 'ญาติพี่น้อง', 'house_number': 11, 'house_type': 'เกณฑ์ชะตา'},
-            'มรณะ': {'thai_meaning': 'เรื่องเจ็บป่วย', 'house_number': 12, 'house_type': 'กาลปักษ์'},
-            'มัชฌิมา': {'thai_meaning': 'เรื่องกลาง ๆ ไม่หนักหนา', 'house_number': 1, 'house_type': 'กาลปักษ์'},
-            'มาตา': {'thai_meaning': 'แม่หรือผู้ใหญ่ เรื่องในบ้าน เรื่องส่วนตัว', 'house_number': 2, 'house_type': 'เกณฑ์ชะตา'},
-            'ลาภะ': {'thai_meaning': 'ลาภยศ โชคลาภ', 'house_number': 3, 'house_type': 'จร'},
-            'สหัชชะ': {'thai_meaning': 'เพื่อนฝูง การติดต่อ', 'house_number': 4, 'house_type': 'กาลปักษ์'},
-            'สุภะ': {'thai_meaning': 'ความเจริญรุ่งเรือง', 'house_number': 5, 'house_type': 'เกณฑ์ชะตา'},
-            'หินะ': {'thai_meaning': 'ความผิดหวัง', 'house_number': 6, 'house_type': 'กาลปักษ์'},
-            'อริ': {'thai_meaning': 'ปัญหา อุปสรรค', 'house_number': 7, 'house_type': 'กาลปักษ์'},
-            'อัตตะ': {'thai_meaning': 'ตัวท่านเอง', 'house_number': 8, 'house_type': 'กาลปักษ์'},
-            'โภคา': {'thai_meaning': 'สินทรัพย์', 'house_number': 9, 'house_type': 'จร'},
-        }
+        # Thai position labels and category mappings are shared module-level constants
+        self.day_labels = DAY_LABELS
+        self.month_labels = MONTH_LABELS
+        self.year_labels = YEAR_LABELS
+        self.CATEGORY_MAPPINGS = CATEGORY_MAPPINGS
         self.logger.debug(f"Initialized category mappings with {len(self.CATEGORY_MAPPINGS)} categories")
         
         # Initialize caches with proper sizing
@@ -410,7 +419,7 @@ class MeaningService:
             return topics
             
         except Exception as e:
-            self.logger.error(f"Error identifying topics: {str(e)}")
+            self.logger.error("Error identifying topics: %s", e)
             return {"กัมมะ:ลาภะ"}  # Default to work and fortune pair on error
     
     async def get_category_ids(self, topics: Set[str]) -> List[int]:
@@ -425,9 +434,9 @@ class MeaningService:
                     category_ids.append(category.id)
                     self.logger.debug(f"Found category ID {category.id} for topic {topic}")
                 else:
-                    self.logger.warning(f"No category found for topic: {topic}")
+                    self.logger.warning("No category found for topic: %s", topic)
             except Exception as e:
-                self.logger.error(f"Error getting category for topic {topic}: {str(e)}")
+                self.logger.error("Error getting category for topic %s: %s", topic, e)
                 # Continue with other topics instead of failing entirely
                 
         self.logger.info(f"Retrieved {len(category_ids)} category IDs: {category_ids}")
@@ -599,15 +608,13 @@ class MeaningService:
                             category3_id = combination.get('category3_id', None)
                             
                             if not category1_id or not category2_id:
-                                self.logger.warning(f"Invalid combination data: {combination}")
+                                self.logger.warning("Invalid combination data: %s", combination)
                                 continue
                             
-                            # Get the categories in this combination
-                            cat1 = await self.category_repository.get_by_id(category1_id)
-                            cat2 = await self.category_repository.get_by_id(category2_id)
-                            cat3 = None
-                            if category3_id:
-                                cat3 = await self.category_repository.get_by_id(category3_id)
+                            # Get the categories in this combination concurrently
+                            cat1, cat2, cat3 = await self.extractor.get_combination_categories(
+                                category1_id, category2_id, category3_id
+                            )
                             
                             # Determine base and position from categories
                             if cat1 and cat2:
@@ -634,7 +641,7 @@ class MeaningService:
                                     meanings.append(meaning)
                     except Exception as inner_e:
                         # Log the error but continue processing other readings
-                        self.logger.error(f"Error processing specific reading {reading.id if hasattr(reading, 'id') else 'unknown'}: {str(inner_e)}")
+                        self.logger.error("Error processing specific reading %s: %s", reading.id if hasattr(reading, 'id') else 'unknown', inner_e)
                         continue
             
             # If we have regular categories or not enough specific meanings, get regular readings too
@@ -646,11 +653,16 @@ class MeaningService:
                 regular_readings = await self.reading_repository.get_by_categories(regular_category_ids)
                 self.logger.info(f"Found {len(regular_readings)} relevant readings from regular categories")
                 
+                # Fetch the combinations for all readings up front instead of one query at a time
+                combinations = await self.extractor.get_combinations_by_ids(
+                    [reading.combination_id for reading in regular_readings]
+                )
+                
                 # Convert regular readings to meanings
                 for reading in regular_readings:
                     try:
                         # Get the combination to determine which bases and positions to use
-                        combination = await self.category_repository.get_combination_by_id(reading.combination_id)
+                        combination = combinations.get(reading.combination_id)
                         if combination:
                             # Handle both dictionary and object access patterns
                             category1_id = combination.category1_id if hasattr(combination, 'category1_id') else combination.get('category1_id')
@@ -658,15 +670,13 @@ class MeaningService:
                             category3_id = combination.category3_id if hasattr(combination, 'category3_id') else combination.get('category3_id', None)
                             
                             if not category1_id or not category2_id:
-                                self.logger.warning(f"Invalid combination data: {combination}")
+                                self.logger.warning("Invalid combination data: %s", combination)
                                 continue
                             
-                            # Get the categories in this combination
-                            cat1 = await self.category_repository.get_by_id(category1_id)
-                            cat2 = await self.category_repository.get_by_id(category2_id)
-                            cat3 = None
-                            if category3_id:
-                                cat3 = await self.category_repository.get_by_id(category3_id)
+                            # Get the categories in this combination concurrently
+                            cat1, cat2, cat3 = await self.extractor.get_combination_categories(
+                                category1_id, category2_id, category3_id
+                            )
                             
                             # Determine base and position from categories
                             if cat1 and cat2:
@@ -693,15 +703,11 @@ class MeaningService:
                                     meanings.append(meaning)
                     except Exception as inner_e:
                         # Log the error but continue processing other readings
-                        self.logger.error(f"Error processing regular reading {reading.id if hasattr(reading, 'id') else 'unknown'}: {str(inner_e)}")
+                        self.logger.error("Error processing regular reading %s: %s", reading.id if hasattr(reading, 'id') else 'unknown', inner_e)
                         continue
             
-            # Sort meanings by match score (highest first)
-            meanings.sort(key=lambda m: getattr(m, 'match_score', 0), reverse=True)
-            
-            # Limit to a reasonable number of meanings
-            if len(meanings) > 20:
-                meanings = meanings[:20]
+            # Keep the top 20 meanings by match score (highest first) without sorting them all
+            meanings = heapq.nlargest(20, meanings, key=lambda m: getattr(m, 'match_score', 0))
             
             # Create and return collection
             result = MeaningCollection(items=meanings)
@@ -713,7 +719,7 @@ class MeaningService:
             return result
             
         except Exception as e:
-            self.logger.error(f"Error extracting meanings: {str(e)}", exc_info=True)
+            self.logger.error("Error extracting meanings: %s", e, exc_info=True)
             raise MeaningExtractionError(f"Error extracting meanings: {str(e)}")
     
     async def _get_categories_for_topic(self, topic: str) -> List[Category]:
@@ -738,13 +744,13 @@ class MeaningService:
             # Get the primary category
             primary_category = await self.category_repository.get_by_name(primary_house)
             if not primary_category:
-                self.logger.warning(f"Primary category {primary_house} not found in database")
+                self.logger.warning("Primary category %s not found in database", primary_house)
                 return categories
                 
             # Get the secondary category
             secondary_category = await self.category_repository.get_by_name(secondary_house)
             if not secondary_category:
-                self.logger.warning(f"Secondary category {secondary_house} not found in database")
+                self.logger.warning("Secondary category %s not found in database", secondary_house)
                 return categories
                 
             # Add the categories
@@ -774,7 +780,7 @@ class MeaningService:
                 return categories
             else:
                 # If the category doesn't exist in the database yet, we'll need to create it
-                self.logger.warning(f"Category {topic} not found in database but exists in CATEGORY_MAPPINGS")
+                self.logger.warning("Category %s not found in database but exists in CATEGORY_MAPPINGS", topic)
                 # For now, continue searching by meaning
         
         # Search for categories with matching Thai meanings
@@ -790,7 +796,7 @@ class MeaningService:
                     self.logger.debug(f"Found category {category_name} with relevant Thai meaning: {thai_meaning}")
         
         if not categories:
-            self.logger.warning(f"No categories found for topic: {topic}")
+            self.logger.warning("No categories found for topic: %s", topic)
             
             # As a last resort, try to look up the exact topic name
             try:
@@ -799,7 +805,7 @@ class MeaningService:
                     categories.append(category)
                     self.logger.debug(f"Found category by exact name: {topic}")
             except Exception as e:
-                self.logger.error(f"Error finding category by name: {str(e)}")
+                self.logger.error("Error finding category by name: %s", e)
         
         return categories
     
@@ -807,14 +813,14 @@ class MeaningService:
         """Get a specific meaning by base and position"""
         try:
             if base < 1 or base > 4 or position < 1 or position > 7:
-                self.logger.warning(f"Invalid base {base} or position {position}")
+                self.logger.warning("Invalid base %s or position %s", base, position)
                 return None
                 
             # Get readings for this base and position
             readings = await self.reading_repository.get_by_base_and_position(base, position)
             
             if not readings:
-                self.logger.warning(f"No readings found for base {base}, position {position}")
+                self.logger.warning("No readings found for base %s, position %s", base, position)
                 return None
                 
             # Use the first reading
@@ -839,7 +845,7 @@ class MeaningService:
             return meaning
         
         except Exception as e:
-            self.logger.error(f"Error getting meaning for base {base}, position {position}: {str(e)}")
+            self.logger.error("Error getting meaning for base %s, position %s: %s", base, position, e)
             return None
 
     async def enrich_bases_with_categories(self, bases_result: BasesResult) -> Dict[str, List[Dict[str, Any]]]:
@@ -861,11 +867,22 @@ class MeaningService:
         
         # Get Thai position names from calculator
         thai_positions = {
-            1: self.day_labels if hasattr(self, 'day_labels') else ['อัตตะ', 'หินะ', 'ธานัง', 'ปิตา', 'มาตา', 'โภคา', 'มัชฌิมา'],
-            2: self.month_labels if hasattr(self, 'month_labels') else ['ตะนุ', 'กดุมภะ', 'สหัชชะ', 'พันธุ', 'ปุตตะ', 'อริ', 'ปัตนิ'],
-            3: self.year_labels if hasattr(self, 'year_labels') else ['มรณะ', 'สุภะ', 'กัมมะ', 'ลาภะ', 'พยายะ', 'ทาสา', 'ทาสี']
+            1: self.day_labels,
+            2: self.month_labels,
+            3: self.year_labels
         }
         
+        # Fetch every labelled category in one round-trip instead of one query per position
+        category_error = None
+        try:
+            categories_by_name = await self.category_repository.get_by_names(
+                [name for labels in thai_positions.values() for name in labels]
+            )
+        except Exception as e:
+            self.logger.warning("Error getting categories for position names: %s", e)
+            categories_by_name = {}
+            category_error = str(e)
+        
         result = {}
         
         # Process each base
@@ -874,7 +891,7 @@ class MeaningService:
             base_values = getattr(bases_result.bases, base_key)
             
             if not base_values or len(base_values) != 7:
-                self.logger.warning(f"Invalid values for {base_key}: {base_values}")
+                self.logger.warning("Invalid values for %s: %s", base_key, base_values)
                 result[base_key] = []
                 continue
             
@@ -900,40 +917,29 @@ class MeaningService:
                 
                 # If we have a position name, get category details
                 if thai_position_name:
-                    try:
-                        # Query the database for the category
-                        category = await self.category_repository.get_by_name(thai_position_name)
-                        
-                        if category:
-                            position_data.update({
-                                "category_id": category.id,
-                                "thai_meaning": category.thai_meaning if hasattr(category, 'thai_meaning') else "",
-                                "house_number": category.house_number if hasattr(category, 'house_number') else None,
-                                "house_type": category.house_type if hasattr(category, 'house_type') else "",
-                                "found_in_db": True
-                            })
-                            self.logger.debug(f"Found category for {thai_position_name}: ID={category.id}, Meaning='{getattr(category, 'thai_meaning', '')}'")
-                        else:
-                            # Fallback to hardcoded values if available
-                            position_data.update({
-                                "category_id": None,
-                                "thai_meaning": self.CATEGORY_MAPPINGS.get(thai_position_name, {}).get('thai_meaning', ""),
-                                "house_number": self.CATEGORY_MAPPINGS.get(thai_position_name, {}).get('house_number', None),
-                                "house_type": self.CATEGORY_MAPPINGS.get(thai_position_name, {}).get('house_type', ""),
-                                "found_in_db": False
-                            })
-                            self.logger.debug(f"No category found for {thai_position_name}, using fallback values")
-                    except Exception as e:
-                        self.logger.warning(f"Error getting category for {thai_position_name}: {str(e)}")
-                        # Fallback to hardcoded values
+                    category = categories_by_name.get(thai_position_name)
+                    
+                    if category:
+                        position_data.update({
+                            "category_id": category.id,
+                            "thai_meaning": category.thai_meaning if hasattr(category, 'thai_meaning') else "",
+                            "house_number": category.house_number if hasattr(category, 'house_number') else None,
+                            "house_type": category.house_type if hasattr(category, 'house_type') else "",
+                            "found_in_db": True
+                        })
+                        self.logger.debug(f"Found category for {thai_position_name}: ID={category.id}, Meaning='{getattr(category, 'thai_meaning', '')}'")
+                    else:
+                        # Fallback to hardcoded values if available
                         position_data.update({
                             "category_id": None,
                             "thai_meaning": self.CATEGORY_MAPPINGS.get(thai_position_name, {}).get('thai_meaning', ""),
                             "house_number": self.CATEGORY_MAPPINGS.get(thai_position_name, {}).get('house_number', None),
                             "house_type": self.CATEGORY_MAPPINGS.get(thai_position_name, {}).get('house_type', ""),
-                            "found_in_db": False,
-                            "error": str(e)
+                            "found_in_db": False
                         })
+                        if category_error:
+                            position_data["error"] = category_error
+                        self.logger.debug(f"No category found for {thai_position_name}, using fallback values")
                 
                 enriched_positions.append(position_data)
             
@@ -956,9 +962,32 @@ class MeaningService:
         try:
             self.logger.info("Extracting meanings from bases")
             
+            bases = bases_result.bases if bases_result else None
+            cache_key = None
+            if bases:
+                cache_key = tuple(tuple(sequence or ()) for sequence in bases.sequences)
+                cached_result = self._bases_meaning_cache.get(cache_key)
+                if cached_result is not None:
+                    self.logger.debug("Using cached meanings for bases")
+                    return cached_result.model_copy(deep=True)
+            
             # Enrich bases with category details
             enriched_bases = await self.enrich_bases_with_categories(bases_result)
             
+            # Fetch readings for every known category in one query rather than one per position
+            readings_by_category = None
+            category_ids = [
+                position_data["category_id"]
+                for enriched_positions in enriched_bases.values()
+                for position_data in enriched_positions
+                if position_data.get("category_id")
+            ]
+            if category_ids:
+                try:
+                    readings_by_category = await self.reading_repository.get_grouped_by_categories(category_ids)
+                except Exception as e:
+                    self.logger.warning("Batched reading lookup failed, querying per position: %s", e)
+            
             meanings = []
             
             # Process each base (1-4)
@@ -982,7 +1011,10 @@ class MeaningService:
                         
                         # 1. If we have a category ID, try to get readings by category
                         if category_id:
-                            readings = await self.reading_repository.get_by_categories([category_id])
+                            if readings_by_category is not None:
+                                readings = readings_by_category.get(category_id, [])
+                            else:
+                                readings = await self.reading_repository.get_by_categories([category_id])
                             self.logger.debug(f"Found {len(readings)} readings by category ID {category_id}")
                         
                         # 2. If no readings by category or no category ID, try by base and position
@@ -1015,16 +1047,7 @@ class MeaningService:
                                     heading = reading.heading
                                 else:
                                     # Construct a heading if not available
-                                    base_name = ""
-                                    if base_num == 1:
-                                        base_name = "ฐานวันเกิด"
-                                    elif base_num == 2:
-                                        base_name = "ฐานเดือนเกิด"
-                                    elif base_num == 3:
-                                        base_name = "ฐานปีเกิด"
-                                    elif base_num == 4:
-                                        base_name = "ฐานรวม"
-                                    
+                                    base_name = BASE_HEADINGS.get(base_num, "")
                                     heading = f"{base_name} ตำแหน่ง {position_num} ({thai_position_name})"
                                 
                                 # Get influence type if available
@@ -1040,7 +1063,7 @@ class MeaningService:
                                     match_score += 1.0
                                 
                                 # Adjust score based on value significance
-                                if value in [1, 5, 7]:  # These values are often considered significant
+                                if value in SIGNIFICANT_VALUES:  # These values are often considered significant
                                     match_score += 0.5
                                 
                                 # Create meaning with additional metadata
@@ -1065,28 +1088,27 @@ class MeaningService:
                                 self.logger.debug(f"Added meaning for Base {base_num}, Position {position_num}, Value {value}")
                                 
                             except Exception as inner_e:
-                                self.logger.error(f"Error processing reading: {str(inner_e)}")
+                                self.logger.error("Error processing reading: %s", inner_e)
                                 continue
                     
                     except Exception as position_e:
-                        self.logger.error(f"Error processing position {position_num} in base {base_num}: {str(position_e)}")
+                        self.logger.error("Error processing position %s in base %s: %s", position_num, base_num, position_e)
                         continue
             
-            # Sort meanings by match score (highest first)
-            meanings.sort(key=lambda m: getattr(m, 'match_score', 0), reverse=True)
-            
-            # Limit to a reasonable number of meanings
-            if len(meanings) > 20:
-                meanings = meanings[:20]
+            # Keep the top 20 meanings by match score (highest first) without sorting them all
+            meanings = heapq.nlargest(20, meanings, key=lambda m: getattr(m, 'match_score', 0))
             
             # Create and return collection
             result = MeaningCollection(items=meanings)
             self.logger.info(f"Extracted {len(meanings)} meanings from bases")
             
+            if cache_key is not None:
+                self._bases_meaning_cache.set(cache_key, result.model_copy(deep=True))
+            
             return result
             
         except Exception as e:
-            self.logger.error(f"Error extracting meanings from bases: {str(e)}", exc_info=True)
+            self.logger.error("Error extracting meanings from bases: %s", e, exc_info=True)
             raise MeaningExtractionError(f"Error extracting meanings from bases: {str(e)}")
 
     async def get_enriched_birth_chart(self, birth_date: datetime, thai_day: Optional[str] = None, question: Optional[str] = None) -> Dict[str, Any]:
@@ -1104,6 +1126,14 @@ class MeaningService:
         try:
             self.logger.info(f"Generating enriched birth chart for {birth_date}, thai_day={thai_day}")
             
+            # Charts without a question are deterministic, so reuse them for follow-up requests
+            chart_cache_key = None if question else (birth_date, thai_day)
+            if chart_cache_key is not None:
+                cached_chart = self._birth_chart_cache.get(chart_cache_key)
+                if cached_chart is not None:
+                    self.logger.debug("Using cached enriched birth chart")
+                    return copy.deepcopy(cached_chart)
+            
             # Get calculator service
             from app.services.calculator import CalculatorService
             calculator = CalculatorService()
@@ -1149,6 +1179,12 @@ class MeaningService:
                             "value": pos["value"]
                         }
             
+            # Group general meanings by base in a single pass
+            meanings_by_base = {base_num: [] for base_num in BASE_HEADINGS}
+            for meaning in general_meanings.items:
+                if meaning.base in meanings_by_base:
+                    meanings_by_base[meaning.base].append(meaning.dict())
+            
             # Prepare the response with optimized general_meanings structure
             result = {
                 "birth_info": {
@@ -1162,22 +1198,11 @@ class MeaningService:
                 "enriched_bases": enriched_bases,
                 "positions_summary": positions_summary,  # Add the positions summary for AI reference
                 "general_meanings": {
-                    "base1": {
-                        "name": "ฐานวันเกิด",
-                        "meanings": [m.dict() for m in general_meanings.items if m.base == 1]
-                    },
-                    "base2": {
-                        "name": "ฐานเดือนเกิด",
-                        "meanings": [m.dict() for m in general_meanings.items if m.base == 2]
-                    },
-                    "base3": {
-                        "name": "ฐานปีเกิด",
-                        "meanings": [m.dict() for m in general_meanings.items if m.base == 3]
-                    },
-                    "base4": {
-                        "name": "ฐานรวม",
-                        "meanings": [m.dict() for m in general_meanings.items if m.base == 4]
+                    f"base{base_num}": {
+                        "name": BASE_HEADINGS[base_num],
+                        "meanings": meanings
                     }
+                    for base_num, meanings in meanings_by_base.items()
                 },
                 "focus_meanings": [meaning.dict() for meaning in focus_meanings.items] if focus_meanings else [],
                 "mapping_analysis": [m.dict() for m in mapping_analysis] if mapping_analysis else []
@@ -1195,10 +1220,13 @@ class MeaningService:
                             f"{len(result['general_meanings'])} general meanings and " +
                             f"{len(result['focus_meanings'])} focus meanings")
             
+            if chart_cache_key is not None:
+                self._birth_chart_cache.set(chart_cache_key, copy.deepcopy(result))
+            
             return result
             
         except Exception as e:
-            self.logger.error(f"Error generating enriched birth chart: {str(e)}", exc_info=True)
+            self.logger.error("Error generating enriched birth chart: %s", e, exc_info=True)
             raise MeaningExtractionError(f"Error generating enriched birth chart: {str(e)}")
 
     async def get_category_by_element_name(self, element_name: str) -> Optional[Category]:
@@ -1222,7 +1250,7 @@ class MeaningService:
             category = await self.category_repository.get_by_thai_name(element_name)
         
         if not category:
-            self.logger.warning(f"No category found for element name: {element_name}")
+            self.logger.warning("No category found for element name: %s", element_name)
         else:
             self.logger.debug(f"Found category: {category.id} - {category.category_name}")
             # Add to cache
@@ -1,17 +1,31 @@
-from typing import Optional, Dict
+from typing import Optional, Tuple
+from collections import OrderedDict
 import aiohttp
-import json
 import os
 from fastapi import Depends
 import hashlib
+import time
 from functools import lru_cache
 
+import orjson
+
 from app.core.logging import get_logger
 from app.config.settings import Settings, get_settings
 
+# Maximum number of completions kept in the shared response cache
+RESPONSE_CACHE_MAX_SIZE = 512
+
 class OpenAIService:
     """Service for interacting with OpenAI API to generate fortune readings"""
     
+    # HTTP session shared by all instances so connections and TLS sessions are reused
+    _session: Optional[aiohttp.ClientSession] = None
+    
+    # Completion cache shared by all instances, since callers create a new service per reading.
+    # Ordered from least to most recently used so the oldest entry is evicted first.
+    # Each entry keeps the time it was stored so it expires after cache_ttl seconds.
+    _response_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+    
     def __init__(self):
         """Initialize the OpenAI service"""
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
@@ -25,14 +39,47 @@ class OpenAIService:
         self.api_base = self.settings.openai_api_base
         self.model = self.settings.openai_model
         
-        # Initialize cache
-        self._response_cache: Dict[str, str] = {}
+        # Request headers and endpoint never change for an instance, so build them once
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        self._completions_url = f"{self.api_base}/chat/completions"
+        
+        # Initialize cache settings
         self._cache_ttl = self.settings.cache_ttl
         
         self.logger.info(f"Initialized OpenAIService with model: {self.model}")
     
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if cls._session is None or cls._session.closed:
+            settings = get_settings()
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=settings.http_max_connections,
+                    limit_per_host=settings.http_max_keepalive_connections,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=settings.http_keepalive_expiry
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    connect=settings.http_connect_timeout,
+                    sock_read=settings.http_read_timeout
+                )
+            )
+        return cls._session
+    
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared HTTP session"""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+    
     def _get_cache_key(self, system_prompt: str, user_prompt: str, max_tokens: int, temperature: float) -> str:
-        """Generate a cache key from the request parameters"""
+        """Generate a cache key from the request parameters, ignoring whitespace-only differences"""
+        user_prompt = " ".join(user_prompt.split())
         key_string = f"{system_prompt}|{user_prompt}|{max_tokens}|{temperature}"
         return hashlib.md5(key_string.encode()).hexdigest()
     
@@ -61,19 +108,21 @@ class OpenAIService:
             
         try:
             # Check cache first if enabled
+            cache_key = None
             if self.settings.enable_cache:
                 cache_key = self._get_cache_key(system_prompt, user_prompt, max_tokens, temperature)
-                if cache_key in self._response_cache:
-                    self.logger.info("Using cached response")
-                    return self._response_cache[cache_key]
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    cached_response, cached_at = cached
+                    if time.monotonic() - cached_at < self._cache_ttl:
+                        self._response_cache.move_to_end(cache_key)
+                        self.logger.info("Using cached response")
+                        return cached_response
+                    # Expired, so drop it and generate a fresh completion
+                    del self._response_cache[cache_key]
             
             self.logger.info(f"Generating reading with {len(user_prompt)} chars of user prompt")
             
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
             messages = [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
@@ -86,33 +135,38 @@ class OpenAIService:
                 "temperature": temperature
             }
             
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.api_base}/chat/completions"
-                async with session.post(url, headers=headers, data=json.dumps(data)) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        self.logger.error(f"OpenAI API error: {response.status} - {error_text}")
-                        return None
-                        
-                    result = await response.json()
-                    
-                    if not result.get("choices") or len(result["choices"]) == 0:
-                        self.logger.error(f"Invalid response from OpenAI: {result}")
-                        return None
-                        
-                    generated_text = result["choices"][0]["message"]["content"].strip()
-                    
-                    # Cache the response if enabled
-                    if self.settings.enable_cache:
-                        cache_key = self._get_cache_key(system_prompt, user_prompt, max_tokens, temperature)
-                        self._response_cache[cache_key] = generated_text
-                    
-                    # Log truncated output
-                    preview = generated_text[:100] + "..." if len(generated_text) > 100 else generated_text
-                    self.logger.info(f"Generated reading: {preview}")
+            # orjson writes the Thai prompt text as raw UTF-8 instead of \uXXXX escapes,
+            # which is faster to encode and makes the request body smaller
+            body = orjson.dumps(data)
+            
+            session = self._get_session()
+            async with session.post(self._completions_url, headers=self._headers, data=body) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    self.logger.error(f"OpenAI API error: {response.status} - {error_text}")
+                    return None
                     
-                    return generated_text
+                result = await response.json()
+                
+                if not result.get("choices") or len(result["choices"]) == 0:
+                    self.logger.error(f"Invalid response from OpenAI: {result}")
+                    return None
                     
+                generated_text = result["choices"][0]["message"]["content"].strip()
+                
+                # Cache the response if enabled, evicting the least recently used entry when full
+                if cache_key is not None:
+                    self._response_cache[cache_key] = (generated_text, time.monotonic())
+                    self._response_cache.move_to_end(cache_key)
+                    if len(self._response_cache) > RESPONSE_CACHE_MAX_SIZE:
+                        self._response_cache.popitem(last=False)
+                
+                # Log truncated output
+                preview = generated_text[:100] + "..." if len(generated_text) > 100 else generated_text
+                self.logger.info(f"Generated reading: {preview}")
+                
+                return generated_text
+                
         except Exception as e:
             self.logger.error(f"Error in chat completion: {str(e)}", exc_info=True)
             return None
@@ -1,12 +1,28 @@
 from typing import Optional, Dict, Any, List
-from datetime import datetime
+import time
 
 from app.domain.birth import BirthInfo
 from app.domain.bases import Bases
 from app.domain.meaning import MeaningCollection
 from app.core.logging import get_logger
-from app.config.settings import Settings
+from app.config.settings import get_settings
 from app.services.ai_topic_service import MappingAnalysis
+from app.config.thai_astrology import DAY_LABELS, MONTH_LABELS, YEAR_LABELS
+
+# House descriptions in Thai, preformatted once for the user prompt
+HOUSE_DESCRIPTIONS = {
+    "อัตตะ": "ตัวเอง บุคลิกภาพ ร่างกาย",
+    "หินะ": "ทรัพย์สิน เงินทอง",
+    "ธานัง": "พี่น้อง ญาติพี่น้อง การเดินทาง",
+    "ปิตา": "บิดา บ้าน ที่อยู่อาศัย",
+    "มาตา": "มารดา บุตร ความรัก",
+    "โภคา": "สุขภาพ การงาน ลูกน้อง",
+    "มัชฌิมา": "คู่ครอง หุ้นส่วน",
+}
+HOUSE_DESCRIPTIONS_TEXT = "\n".join(f"- {house}: {desc}" for house, desc in HOUSE_DESCRIPTIONS.items())
+
+# Mapping significance levels that are called out in prompts
+SIGNIFICANT_MAPPING_LEVELS = frozenset(("สำคัญมาก", "สำคัญ"))
 
 
 class PromptService:
@@ -26,7 +42,7 @@ class PromptService:
         Initialize the PromptService, setting up a logger, context storage, and default templates.
         """
         self.logger = get_logger(__name__)
-        self.settings = Settings()
+        self.settings = get_settings()
 
         # Conversation context storage
         self._conversation_contexts: Dict[str, Dict[str, Any]] = {}
@@ -257,6 +273,20 @@ class PromptService:
             },
         }
 
+        # Strip the static prompts once here rather than on every request
+        self._stripped_system_prompts = {
+            "thai": self.fortune_thai_prompt.strip(),
+            "english": self.fortune_english_prompt.strip(),
+        }
+        self._stripped_general_prompts = {
+            "thai": self.general_thai_prompt.strip(),
+            "english": self.general_english_prompt.strip(),
+        }
+        self._stripped_topic_prompts = {
+            topic: {lang: text.strip() for lang, text in prompts.items()}
+            for topic, prompts in self.topic_prompts.items()
+        }
+
     def _update_conversation_context(
         self,
         user_id: str,
@@ -268,7 +298,7 @@ class PromptService:
         Update the conversation context for a specific user.
         Tracks topics, sentiment, and key points. Also refreshes 'last_update' for TTL checks.
         """
-        current_time = datetime.now().timestamp()
+        current_time = time.monotonic()
 
         if user_id not in self._conversation_contexts:
             self._conversation_contexts[user_id] = {
@@ -290,20 +320,21 @@ class PromptService:
         context["key_points"] = context["key_points"][-10:]
 
         # Clean up expired contexts
-        self._cleanup_old_contexts()
+        self._cleanup_old_contexts(current_time)
 
-    def _cleanup_old_contexts(self) -> None:
+    def _cleanup_old_contexts(self, current_time: Optional[float] = None) -> None:
         """
         Remove conversation contexts that haven't been updated within the TTL period.
         """
-        current_time = datetime.now().timestamp()
+        if current_time is None:
+            current_time = time.monotonic()
         expired_users = [
             user_id
             for user_id, context in self._conversation_contexts.items()
             if current_time - context["last_update"] > self._context_ttl
         ]
         for user_id in expired_users:
-            del self._conversation_contexts[user_id]
+            self._conversation_contexts.pop(user_id, None)
 
     def _get_context_variables(self, user_id: str) -> Dict[str, Any]:
         """
@@ -382,7 +413,7 @@ class PromptService:
         )
 
         if not user_id:
-            return base_prompt.strip()
+            return self._stripped_system_prompts["thai" if language.lower() == "thai" else "english"]
 
         # Pull context variables
         context_vars = self._get_context_variables(user_id)
@@ -454,40 +485,26 @@ class PromptService:
             # Prepare meanings
             meanings_str = ""
             if meanings and hasattr(meanings, "items"):
-                for meaning in meanings.items:
-                    if meaning:
-                        meanings_str += f"- {meaning.description}\n"
-
-            # Thai labels for demonstration
-            day_labels = ["อัตตะ", "หินะ", "ธานัง", "ปิตา", "มาตา", "โภคา", "มัชฌิมา"]
-            month_labels = ["ตะนุ", "กดุมภะ", "สหัชชะ", "พันธุ", "ปุตตะ", "อริ", "ปัตนิ"]
-            year_labels = ["มรณะ", "สุภะ", "กัมมะ", "ลาภะ", "พยายะ", "ทาสา", "ทาสี"]
+                meanings_str = "".join(
+                    f"- {meaning.description}\n" for meaning in meanings.items if meaning
+                )
 
             # Detailed base descriptions with labels
             base1_detail = " | ".join(
-                f"{label}: {value}" for label, value in zip(day_labels, bases.base1)
+                f"{label}: {value}" for label, value in zip(DAY_LABELS, bases.base1)
             )
             base2_detail = " | ".join(
-                f"{label}: {value}" for label, value in zip(month_labels, bases.base2)
+                f"{label}: {value}" for label, value in zip(MONTH_LABELS, bases.base2)
             )
             base3_detail = " | ".join(
-                f"{label}: {value}" for label, value in zip(year_labels, bases.base3)
+                f"{label}: {value}" for label, value in zip(YEAR_LABELS, bases.base3)
             )
             base4_detail = " | ".join(
-                f"{label}: {value}" for label, value in zip(day_labels, bases.base4)
+                f"{label}: {value}" for label, value in zip(DAY_LABELS, bases.base4)
             )
 
             # House descriptions in Thai
-            house_descriptions = {
-                "อัตตะ": "ตัวเอง บุคลิกภาพ ร่างกาย",
-                "หินะ": "ทรัพย์สิน เงินทอง",
-                "ธานัง": "พี่น้อง ญาติพี่น้อง การเดินทาง",
-                "ปิตา": "บิดา บ้าน ที่อยู่อาศัย",
-                "มาตา": "มารดา บุตร ความรัก",
-                "โภคา": "สุขภาพ การงาน ลูกน้อง",
-                "มัชฌิมา": "คู่ครอง หุ้นส่วน",
-            }
-            house_desc_str = "\n".join(f"- {house}: {desc}" for house, desc in house_descriptions.items())
+            house_desc_str = HOUSE_DESCRIPTIONS_TEXT
 
             # Build prompt
             if language.lower() == "english":
@@ -526,7 +543,7 @@ class PromptService:
                 
                 # Add mapping analysis if available
                 if mapping_analysis:
-                    significant_mappings = [m for m in mapping_analysis if m.significance in ["สำคัญมาก", "สำคัญ"]]
+                    significant_mappings = [m for m in mapping_analysis if m.significance in SIGNIFICANT_MAPPING_LEVELS]
                     if significant_mappings:
                         prompt += "\n4. Significant Astrological Factors:\n"
                         for m in significant_mappings:
@@ -577,7 +594,7 @@ class PromptService:
                 
                 # Add mapping analysis if available
                 if mapping_analysis:
-                    significant_mappings = [m for m in mapping_analysis if m.significance in ["สำคัญมาก", "สำคัญ"]]
+                    significant_mappings = [m for m in mapping_analysis if m.significance in SIGNIFICANT_MAPPING_LEVELS]
                     if significant_mappings:
                         prompt += "\n4. ปัจจัยทางดวงที่สำคัญ:\n"
                         for m in significant_mappings:
@@ -646,8 +663,8 @@ class PromptService:
             A simple system prompt aimed at friendly, general interaction.
         """
         if language.lower() == "english":
-            return self.general_english_prompt.strip()
-        return self.general_thai_prompt.strip()
+            return self._stripped_general_prompts["english"]
+        return self._stripped_general_prompts["thai"]
 
     def generate_custom_prompt(self, template: str, variables: Dict[str, str]) -> str:
         """
@@ -678,8 +695,8 @@ class PromptService:
             A string containing the prompt for the requested topic/language, or None if not found.
         """
         try:
-            if topic in self.topic_prompts:
-                return self.topic_prompts[topic][language.lower()].strip()
+            if topic in self._stripped_topic_prompts:
+                return self._stripped_topic_prompts[topic][language.lower()]
             return None
         except Exception as e:
             self.logger.error(f"Error getting topic prompt: {str(e)}")
@@ -1,6 +1,8 @@
 # app/services/reading_service.py
 from typing import Dict, List, Optional, Tuple, Any
+from collections import OrderedDict
 import re
+import heapq
 from fastapi import Depends
 from datetime import datetime
 from functools import lru_cache
@@ -16,6 +18,146 @@ from app.services.calculator import CalculatorService
 from app.services.session_service import get_session_manager
 from app.services.ai_topic_service import AITopicService, UserMapping, MappingAnalysis, TopicDetectionResult
 from app.core.error_handler import catch_errors
+from app.config.thai_astrology import DAY_LABELS, MONTH_LABELS, YEAR_LABELS
+
+# Regex patterns compiled once at import time
+ELEMENT_PATTERN = re.compile(r'\(([^)]+)\)')
+VALUE_PATTERN = re.compile(r'[:：]\s*(\d+)')
+DIGIT_PATTERN = re.compile(r'\b(\d+)\b')
+
+# Thai position names for bases 1-3 (day, month, year); base 4 (sum) has no labels
+THAI_POSITIONS: Dict[int, Tuple[str, ...]] = {
+    1: tuple(DAY_LABELS),
+    2: tuple(MONTH_LABELS),
+    3: tuple(YEAR_LABELS),
+}
+
+# Thai position name -> (base, position), both 1-indexed
+POSITION_MAPPINGS: Dict[str, Tuple[int, int]] = {
+    name: (base, index + 1)
+    for base, names in THAI_POSITIONS.items()
+    for index, name in enumerate(names)
+}
+
+# Base names used in reading headings (Thai to index), in priority order:
+# an explicit ฐานN wins over a word such as วัน wherever either appears
+BASE_NAME_MAPPINGS: Dict[str, int] = {
+    'ฐาน1': 1,
+    'ฐาน2': 2,
+    'ฐาน3': 3,
+    'ฐาน4': 4,
+    'ผลรวม': 4,   # Sum
+    'เดือน': 2,   # Month
+    'วัน': 1,     # Day
+    'ปี': 3       # Year
+}
+
+# One alternation over the base names, so a heading is scanned once for all of them
+BASE_NAME_PATTERN = re.compile("|".join(re.escape(name) for name in BASE_NAME_MAPPINGS))
+
+# Rank of each base name in BASE_NAME_MAPPINGS, lower is higher priority
+BASE_NAME_PRIORITY: Dict[str, int] = {name: rank for rank, name in enumerate(BASE_NAME_MAPPINGS)}
+
+# Short base names indexed by base - 1
+BASE_NAMES: Tuple[str, ...] = ('วัน', 'เดือน', 'ปี', 'ผลรวม')
+
+# Thai zodiac animals with common names, indexed by (year - 4) % 12
+YEAR_ANIMALS: Tuple[str, ...] = (
+    "ชวด (หนู)", "ฉลู (วัว)", "ขาล (เสือ)", "เถาะ (กระต่าย)", 
+    "มะโรง (งูใหญ่)", "มะเส็ง (งูเล็ก)", "มะเมีย (ม้า)", "มะแม (แพะ)", 
+    "วอก (ลิง)", "ระกา (ไก่)", "จอ (หมา)", "กุน (หมู)"
+)
+
+# Heading for a locally generated reading, keyed by topic
+TOPIC_READING_HEADINGS: Dict[str, str] = {
+    'การเงิน': "คำทำนายเรื่องการเงินและทรัพย์สิน",
+    'ความรัก': "คำทำนายเรื่องความรักและความสัมพันธ์",
+    'สุขภาพ': "คำทำนายเรื่องสุขภาพและความเป็นอยู่",
+    'การงาน': "คำทำนายเรื่องการงานและอาชีพ",
+    'การศึกษา': "คำทำนายเรื่องการศึกษาและการเรียนรู้",
+    'ครอบครัว': "คำทำนายเรื่องครอบครัวและบ้าน",
+    'โชคลาภ': "คำทำนายเรื่องโชคลาภและความสำเร็จ",
+    'อนาคต': "คำทำนายเรื่องอนาคตและชะตาชีวิต",
+    'การเดินทาง': "คำทำนายเรื่องการเดินทางและการย้ายถิ่น",
+    'ทั่วไป': "คำทำนายเรื่องทั่วไป"
+}
+
+# Closing paragraph for a locally generated reading, keyed by topic
+TOPIC_READING_CONCLUSIONS: Dict[str, str] = {
+    'การเงิน': "ในด้านการเงิน คุณควรระมัดระวังการใช้จ่ายและวางแผนการเงินอย่างรอบคอบในช่วงนี้ การลงทุนควรพิจารณาอย่างรอบด้านและไม่ประมาท",
+    'ความรัก': "สำหรับความรัก การสื่อสารอย่างเปิดใจจะช่วยเสริมสร้างความเข้าใจและความสัมพันธ์ที่ดี ให้ความสำคัญกับความรู้สึกของคนรอบข้าง",
+    'สุขภาพ': "ด้านสุขภาพ ควรดูแลตัวเองอย่างสม่ำเสมอ ออกกำลังกายพอประมาณและพักผ่อนให้เพียงพอ หลีกเลี่ยงความเครียดสะสม",
+    'การงาน': "ในเรื่องการงาน ความขยันและความอดทนจะนำไปสู่ความสำเร็จ อย่ากลัวที่จะเรียนรู้สิ่งใหม่ๆและพัฒนาทักษะของตัวเอง",
+    'การศึกษา': "สำหรับการศึกษา ควรตั้งใจเรียนและแบ่งเวลาอย่างมีประสิทธิภาพ การทบทวนบทเรียนอย่างสม่ำเสมอจะช่วยให้เข้าใจเนื้อหาได้ดียิ่งขึ้น",
+    'ครอบครัว': "ในด้านครอบครัว ควรให้เวลากับคนในครอบครัวและรับฟังความคิดเห็นของทุกคน ความเข้าใจและการให้อภัยจะช่วยรักษาความสัมพันธ์ที่ดี",
+    'โชคลาภ': "สำหรับโชคลาภ โอกาสดีๆ อาจเข้ามาโดยไม่คาดคิด แต่อย่าหวังพึ่งโชคชะตาเพียงอย่างเดียว ความพยายามและความขยันเป็นสิ่งสำคัญ",
+    'อนาคต': "สำหรับอนาคต การวางแผนและเตรียมพร้อมรับมือกับการเปลี่ยนแปลงจะช่วยให้คุณก้าวไปข้างหน้าได้อย่างมั่นคง",
+    'การเดินทาง': "ในเรื่องการเดินทาง ควรวางแผนและเตรียมตัวให้พร้อม ศึกษาข้อมูลเส้นทางและสถานที่ให้ละเอียดเพื่อความปลอดภัยและความราบรื่น",
+    'ทั่วไป': "การสร้างสมดุลในชีวิตทั้งด้านการงาน การเงิน ความสัมพันธ์ และสุขภาพ จะนำมาซึ่งความสุขและความสำเร็จที่ยั่งยืน ใช้ชีวิตด้วยความไม่ประมาทและมีสติอยู่เสมอ"
+}
+
+DEFAULT_READING_CONCLUSION = "ขอให้คุณพบเจอแต่สิ่งดีๆ และมีความสุขในชีวิต"
+
+# Categories and keywords related to each topic, used to score meanings for a topic
+TOPIC_RELATED_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    'การเงิน': ('หินะ', 'ทรัพย์', 'เงิน', 'ธุรกิจ', 'กดุมภะ', 'ลาภะ', 'โภคา', 'ธานัง'),
+    'ความรัก': ('มาตา', 'คู่ครอง', 'ความรัก', 'ปุตตะ', 'ปัตนิ', 'สหัชชะ'),
+    'สุขภาพ': ('โภคา', 'อัตตะ', 'ร่างกาย', 'สุขภาพ', 'ตะนุ', 'มรณะ'),
+    'การงาน': ('โภคา', 'กัมมะ', 'อาชีพ', 'หน้าที่', 'งาน', 'ทาสา', 'ทาสี'),
+    'การศึกษา': ('ธานัง', 'การเรียนรู้', 'วิชาการ', 'สหัชชะ', 'ปุตตะ'),
+    'ครอบครัว': ('ปิตา', 'มาตา', 'บ้าน', 'ครอบครัว', 'พันธุ', 'ปุตตะ'),
+    'โชคลาภ': ('ลาภะ', 'โชค', 'หินะ', 'ทรัพย์', 'สุภะ', 'กดุมภะ'),
+    'อนาคต': ('พยายะ', 'อนาคต', 'แนวโน้ม', 'ทิศทาง', 'ลาภะ'),
+    'การเดินทาง': ('ธานัง', 'สหัชชะ', 'เดินทาง', 'ย้ายถิ่น', 'สุภะ')
+}
+
+DEFAULT_RELATED_CATEGORIES: Tuple[str, ...] = ('กัมมะ', 'ลาภะ', 'สุภะ', 'อัตตะ')
+
+# Keywords marking a general reading as finance-heavy
+FINANCIAL_KEYWORDS: Tuple[str, ...] = ('เงิน', 'ทอง', 'ทรัพย์', 'สมบัติ', 'ธุรกิจ', 'กำไร', 'รายได้', 'ลงทุน', 'การเงิน', 'ฐานะ')
+
+# Topics that are used directly as a reading's influence type
+STANDARD_INFLUENCE_TYPES = frozenset(('การเงิน', 'ความรัก', 'สุขภาพ', 'การงาน', 'การศึกษา', 'ครอบครัว', 'โชคลาภ', 'อนาคต', 'การเดินทาง'))
+
+# Keywords used to infer an influence type from a reading's text
+POSITIVE_INFLUENCE_KEYWORDS: Tuple[str, ...] = ('ดี', 'เจริญ', 'รุ่งเรือง', 'สำเร็จ', 'โชคลาภ', 'มั่งมี', 'สมหวัง', 'สุข')
+NEGATIVE_INFLUENCE_KEYWORDS: Tuple[str, ...] = ('ไม่ดี', 'ระวัง', 'อันตราย', 'เสีย', 'ยาก', 'ลำบาก', 'ทุกข์')
+
+# Paragraph appended to finance-heavy general readings to balance them
+GENERAL_BALANCE_CONTEXT = (
+    "\n\nนอกจากด้านการเงินแล้ว คุณยังมีโอกาสดีในด้านความสัมพันธ์และการพัฒนาตนเอง "
+    "คุณมีความสามารถในการสร้างความสัมพันธ์ที่ดีกับผู้คนรอบข้าง และมีแนวโน้มที่จะประสบความสำเร็จในสิ่งที่ตั้งใจทำ "
+    "ควรให้ความสำคัญกับการดูแลสุขภาพและครอบครัวควบคู่ไปกับการพัฒนาด้านการงานและการเงิน"
+)
+
+
+# Services used for AI readings, imported on first use to avoid circular imports
+_ai_reading_dependencies: Optional[Tuple[Any, Any, Any]] = None
+
+
+def _get_ai_reading_dependencies() -> Optional[Tuple[Any, Any, Any]]:
+    """
+    Import the services used by AI reading generation once and cache them
+    
+    Returns:
+        Tuple of (PromptService, OpenAIService, MeaningService) classes, or None if the
+        prompt or OpenAI service cannot be imported. MeaningService may be None.
+    """
+    global _ai_reading_dependencies
+    if _ai_reading_dependencies is None:
+        try:
+            from app.services.prompt import PromptService
+            from app.services.openai_service import OpenAIService
+        except ImportError:
+            return None
+        
+        try:
+            from app.services.meaning import MeaningService
+        except ImportError:
+            MeaningService = None
+        
+        _ai_reading_dependencies = (PromptService, OpenAIService, MeaningService)
+    return _ai_reading_dependencies
 
 
 class ReadingMatcher:
@@ -25,11 +167,11 @@ class ReadingMatcher:
         """Initialize the reading matcher"""
         self.logger = logger
         
-        # Compile regex patterns for performance
-        self.element_pattern = re.compile(r'\(([^)]+)\)')
-        self.position_pattern = re.compile(r'\(([^)]+)\)')
-        self.value_pattern = re.compile(r'[:：]\s*(\d+)')
-        self.digit_pattern = re.compile(r'\b(\d+)\b')
+        # Use the module-level compiled regex patterns
+        self.element_pattern = ELEMENT_PATTERN
+        self.position_pattern = ELEMENT_PATTERN
+        self.value_pattern = VALUE_PATTERN
+        self.digit_pattern = DIGIT_PATTERN
     
     def extract_attributes_from_heading(self, reading: Reading) -> Tuple[Optional[int], Optional[int], Optional[int]]:
         """
@@ -48,46 +190,6 @@ class ReadingMatcher:
             # Initialize with None values
             extracted_base, extracted_position, extracted_value = None, None, None
             
-            # First, look for Thai position names in the heading
-            position_mappings = {
-                # Base 1 (Day)
-                'อัตตะ': (1, 1),
-                'หินะ': (1, 2),
-                'ธานัง': (1, 3),
-                'ปิตา': (1, 4),
-                'มาตา': (1, 5),
-                'โภคา': (1, 6),
-                'มัชฌิมา': (1, 7),
-                # Base 2 (Month)
-                'ตะนุ': (2, 1),
-                'กดุมภะ': (2, 2),
-                'สหัชชะ': (2, 3),
-                'พันธุ': (2, 4),
-                'ปุตตะ': (2, 5),
-                'อริ': (2, 6),
-                'ปัตนิ': (2, 7),
-                # Base 3 (Year)
-                'มรณะ': (3, 1),
-                'สุภะ': (3, 2),
-                'กัมมะ': (3, 3),
-                'ลาภะ': (3, 4),
-                'พยายะ': (3, 5),
-                'ทาสา': (3, 6),
-                'ทาสี': (3, 7)
-            }
-            
-            # Base name mappings (Thai to index)
-            base_name_mappings = {
-                'วัน': 1,     # Day
-                'เดือน': 2,   # Month
-                'ปี': 3,      # Year
-                'ผลรวม': 4,   # Sum
-                'ฐาน1': 1,
-                'ฐาน2': 2,
-                'ฐาน3': 3,
-                'ฐาน4': 4
-            }
-            
             heading = reading.heading.strip()
             
             # Extract position names from parentheses
@@ -96,15 +198,19 @@ class ReadingMatcher:
             # Process the found position names
             for position_name in position_matches:
                 position_name = position_name.strip()
-                if position_name in position_mappings:
-                    extracted_base, extracted_position = position_mappings[position_name]
+                if position_name in POSITION_MAPPINGS:
+                    extracted_base, extracted_position = POSITION_MAPPINGS[position_name]
                     break
             
             # Look for base names in the heading (like "ฐาน1", "วัน", etc.)
-            for base_name, base_index in base_name_mappings.items():
-                if base_name in heading:
-                    extracted_base = base_index
-                    break
+            # Take the highest-priority name found, not the leftmost one
+            base_match = min(
+                BASE_NAME_PATTERN.finditer(heading),
+                key=lambda match: BASE_NAME_PRIORITY[match.group(0)],
+                default=None
+            )
+            if base_match:
+                extracted_base = BASE_NAME_MAPPINGS[base_match.group(0)]
             
             # Look for values (numbers 1-9) in the heading
             # First try looking for value after colon
@@ -135,7 +241,7 @@ class ReadingMatcher:
                 if content:
                     # Look for numbers in first line of content
                     first_line = content.split('\n')[0]
-                    digit_matches = re.findall(r'\b(\d+)\b', first_line)
+                    digit_matches = self.digit_pattern.findall(first_line)
                     for match in digit_matches:
                         try:
                             value = int(match)
@@ -160,7 +266,7 @@ class ReadingMatcher:
                 extracted_base = 1
                 extracted_position = 1
             
-            self.logger.debug(f"Extracted from heading '{heading[:30]}...': Base={extracted_base}, Position={extracted_position}, Value={extracted_value}")
+            self.logger.debug("Extracted from heading '%s...': Base=%s, Position=%s, Value=%s", heading[:30], extracted_base, extracted_position, extracted_value)
             return extracted_base, extracted_position, extracted_value
             
         except Exception as e:
@@ -196,37 +302,34 @@ class ReadingMatcher:
                 if reading_value is None and extracted_value is not None:
                     reading_value = extracted_value
             
-            # Log the reading attributes for debugging
-            self.logger.debug(f"Checking reading - Base: {base}, Position: {position}, Value: {reading_value}")
+            # Log the reading attributes for debugging. This runs once per candidate reading,
+            # so use lazy %-formatting to skip building the message when debug is off.
+            self.logger.debug("Checking reading - Base: %s, Position: %s, Value: %s", base, position, reading_value)
             
             # If still missing essential attributes, can't match
             if base is None and position is None:
-                self.logger.debug(f"Reading missing both base and position: {reading.heading[:50]}")
+                self.logger.debug("Reading missing both base and position: %s", reading.heading[:50])
                 return True  # Allow matching to continue with defaults
                 
+            # Base sequences indexed by base number - 1, so every branch below is a plain index
+            base_sequences = calculator_result.bases.sequences
+            
             # Get the base sequence if we have a base
             if base is not None:
                 if not 1 <= base <= 4:
-                    self.logger.debug(f"Invalid base: {base}")
+                    self.logger.debug("Invalid base: %s", base)
                     return False
-                    
-                base_sequences = {
-                    1: calculator_result.bases.base1,
-                    2: calculator_result.bases.base2, 
-                    3: calculator_result.bases.base3,
-                    4: calculator_result.bases.base4
-                }
                 
-                sequence = base_sequences.get(base, [])
+                sequence = base_sequences[base - 1]
                 
                 # Check if position is within sequence bounds
                 if position is not None:
                     if not 1 <= position <= 7:
-                        self.logger.debug(f"Invalid position: {position}")
+                        self.logger.debug("Invalid position: %s", position)
                         return False
                         
                     if position > len(sequence):
-                        self.logger.debug(f"Position {position} out of bounds for base {base} (length: {len(sequence)})")
+                        self.logger.debug("Position %s out of bounds for base %s (length: %s)", position, base, len(sequence))
                         return False
                         
                     # Get the value at this position
@@ -238,13 +341,13 @@ class ReadingMatcher:
                         mod9_match = (reading_value % 9 == actual_value % 9) and reading_value > 0 and actual_value > 0
                         
                         if mod9_match:
-                            self.logger.debug(f"Value mod9 match: {reading_value} ≈ {actual_value}")
+                            self.logger.debug("Value mod9 match: %s ≈ %s", reading_value, actual_value)
                             return True
                         elif reading_value == actual_value:
-                            self.logger.debug(f"Direct value match: {reading_value} == {actual_value}")
+                            self.logger.debug("Direct value match: %s == %s", reading_value, actual_value)
                             return True
                         else:
-                            self.logger.debug(f"Value mismatch: {reading_value} != {actual_value}")
+                            self.logger.debug("Value mismatch: %s != %s", reading_value, actual_value)
                             return False
                     
                     # If no value specified in reading, consider it a match
@@ -252,20 +355,18 @@ class ReadingMatcher:
             
             # If we have no base but have a position, try matching against all bases
             if base is None and position is not None:
-                for b in range(1, 5):
-                    sequence = getattr(calculator_result.bases, f"base{b}", [])
+                for b, sequence in enumerate(base_sequences, start=1):
                     if position <= len(sequence):
                         actual_value = sequence[position - 1]
                         if reading_value is None or reading_value == actual_value:
-                            self.logger.debug(f"Found match in base {b} at position {position}")
+                            self.logger.debug("Found match in base %s at position %s", b, position)
                             return True
             
             # If we only have a value, check if it appears in any base
             if base is None and position is None and reading_value is not None:
-                for b in range(1, 5):
-                    sequence = getattr(calculator_result.bases, f"base{b}", [])
+                for b, sequence in enumerate(base_sequences, start=1):
                     if reading_value in sequence:
-                        self.logger.debug(f"Found value {reading_value} in base {b}")
+                        self.logger.debug("Found value %s in base %s", reading_value, b)
                         return True
             
             # If we have no specific attributes to match, consider it a potential match
@@ -332,6 +433,14 @@ class ReadingMatcher:
 class ReadingService:
     """Service for extracting and matching readings from calculator results"""
     
+    # Meanings depend only on the calculator result, so results are shared by all instances
+    # (the app and the module-level factory each create one). Rebuilding the readings tables
+    # requires a restart or clear_meanings_cache() for new rows to show up.
+    _MEANINGS_CACHE_SIZE = 1024
+    # Callers adjust match_score on the meanings they get back, so the cache keeps its own
+    # copies in a tuple and every lookup hands out fresh copies
+    _meanings_cache: "OrderedDict[str, Tuple[Meaning, ...]]" = OrderedDict()
+    
     def __init__(
         self,
         reading_repository: ReadingRepository,
@@ -356,15 +465,12 @@ class ReadingService:
         
         self.logger.info("ReadingService initialized")
         
-        # Compile regex patterns for performance
-        self.element_pattern = re.compile(r'\(([^)]+)\)')
+        # Use the module-level compiled regex pattern
+        self.element_pattern = ELEMENT_PATTERN
         
         # Cache for category lookups
         self._category_cache = {}
         
-        # Cache for meanings
-        self._meanings_cache = {}
-        
         self.calculator_service = CalculatorService()
         
         self.matcher = ReadingMatcher(self.logger)
@@ -432,18 +538,11 @@ class ReadingService:
         """
         self.logger.debug(f"Getting readings for base {base}, position {position}")
         
-        # Define Thai position names for each base
-        thai_positions = {
-            1: ['อัตตะ', 'หินะ', 'ธานัง', 'ปิตา', 'มาตา', 'โภคา', 'มัชฌิมา'],  # Base 1 (Day)
-            2: ['ตะนุ', 'กดุมภะ', 'สหัชชะ', 'พันธุ', 'ปุตตะ', 'อริ', 'ปัตนิ'],  # Base 2 (Month)
-            3: ['มรณะ', 'สุภะ', 'กัมมะ', 'ลาภะ', 'พยายะ', 'ทาสา', 'ทาสี'],    # Base 3 (Year)
-        }
-        
         try:
             # Get the Thai position name if available
             thai_position_name = ""
-            if base < 4 and position <= len(thai_positions[base]):
-                thai_position_name = thai_positions[base][position - 1]  # Convert to 0-indexed for array access
+            if base < 4 and position <= len(THAI_POSITIONS[base]):
+                thai_position_name = THAI_POSITIONS[base][position - 1]  # Convert to 0-indexed for array access
                 self.logger.debug(f"Base {base}, Position {position} corresponds to '{thai_position_name}'")
             
             # Try to get readings in two ways:
@@ -514,20 +613,13 @@ class ReadingService:
             self.logger.info(f"Base 3 (Year): {base3}")
             self.logger.info(f"Base 4 (Sum): {base4}")
             
-            # Log expected positions for key matches
-            base_labels = {
-                1: ["อัตตะ", "หินะ", "ธานัง", "ปิตา", "มาตา", "โภคา", "มัชฌิมา"],
-                2: ["ตะนุ", "กดุมภะ", "สหัชชะ", "พันธุ", "ปุตตะ", "อริ", "ปัตนิ"],
-                3: ["มรณะ", "สุภะ", "กัมมะ", "ลาภะ", "พยายะ", "ทาสา", "ทาสี"]
-            }
-            
             # Log each position's value
             for base_num in range(1, 5):
                 base_key = f"base{base_num}"
                 base_values = getattr(bases, base_key, [])
                 
                 if base_num < 4 and base_values:
-                    labels = base_labels[base_num]
+                    labels = THAI_POSITIONS[base_num]
                     for i, (label, value) in enumerate(zip(labels, base_values)):
                         self.logger.info(f"Base {base_num}, Position {i+1} ({label}): {value}")
                 elif base_values:
@@ -555,22 +647,15 @@ class ReadingService:
             List of matching meanings
         """
         try:
-            # Define Thai position names for each base
-            thai_positions = {
-                1: ['อัตตะ', 'หินะ', 'ธานัง', 'ปิตา', 'มาตา', 'โภคา', 'มัชฌิมา'],  # Base 1 (Day)
-                2: ['ตะนุ', 'กดุมภะ', 'สหัชชะ', 'พันธุ', 'ปุตตะ', 'อริ', 'ปัตนิ'],  # Base 2 (Month)
-                3: ['มรณะ', 'สุภะ', 'กัมมะ', 'ลาภะ', 'พยายะ', 'ทาสา', 'ทาสี'],    # Base 3 (Year)
-            }
-            
             # Skip if invalid base or position
-            if base_num not in thai_positions or position > len(thai_positions[base_num]):
+            if base_num not in THAI_POSITIONS or position > len(THAI_POSITIONS[base_num]):
                 return []
                 
             # Get category name for this base and position
-            category_name = thai_positions[base_num][position - 1]  # Convert to 0-indexed
+            category_name = THAI_POSITIONS[base_num][position - 1]  # Convert to 0-indexed
             
             # Get value from calculator result
-            base_sequence = getattr(calculator_result.bases, f"base{base_num}", [])
+            base_sequence = calculator_result.bases.sequences[base_num - 1]
             value = base_sequence[position - 1] if position <= len(base_sequence) else 0
             
             self.logger.debug(f"Finding readings for Base {base_num}, Position {position}, Category {category_name}, Value {value}")
@@ -664,13 +749,13 @@ class ReadingService:
             # Generate cache key
             try:
                 hash_key = self._generate_hash_key(calculator_result)
-                cache_key = f"meanings:{hash_key}"
                 
-                # Check cache if available
-                # We'll use in-memory class cache
-                if hash_key in self._meanings_cache:
+                # Check the shared in-memory cache
+                cached_meanings = self._meanings_cache.get(hash_key)
+                if cached_meanings is not None:
+                    self._meanings_cache.move_to_end(hash_key)
                     self.logger.info(f"Found cached meanings for calculator result")
-                    return self._meanings_cache[hash_key]
+                    return [meaning.model_copy() for meaning in cached_meanings]
             except Exception as cache_error:
                 self.logger.error(f"Error with cache operations: {str(cache_error)}")
                 # Continue without caching if there's an error
@@ -730,10 +815,9 @@ class ReadingService:
                 self.logger.info("Direct matches insufficient, trying category-based matching")
                 
                 # Try finding matches for all positions in all bases
-                for base_num in range(1, 5):  # Bases 1-4
+                for base_num, base_sequence in enumerate(calculator_result.bases.sequences, start=1):  # Bases 1-4
                     for position in range(1, 8):  # Positions 1-7
                         # Don't query for positions beyond the actual length of the base
-                        base_sequence = getattr(calculator_result.bases, f"base{base_num}", [])
                         if base_num <= 3 and position <= len(base_sequence):
                             found_matches = await self._find_readings_by_categories(calculator_result, base_num, position)
                             if found_matches:
@@ -775,20 +859,16 @@ class ReadingService:
                     seen_headings[heading] = len(unique_meanings)
                     unique_meanings.append(meaning)
             
-            # Sort by match score, highest first
-            result = sorted(unique_meanings, key=lambda m: getattr(m, 'match_score', 0), reverse=True)
-            
-            # Limit results to a reasonable number
-            result = result[:50]  # Return top 50 meanings
+            # Keep the top 50 meanings by match score, highest first
+            result = heapq.nlargest(50, unique_meanings, key=lambda m: getattr(m, 'match_score', 0))
             
             # Cache the results in memory
             try:
-                self._meanings_cache[hash_key] = result
-                # Limit the cache size to prevent memory issues
-                if len(self._meanings_cache) > 100:
-                    # Remove oldest entry (not the most efficient but works for now)
-                    oldest_key = next(iter(self._meanings_cache))
-                    self._meanings_cache.pop(oldest_key)
+                self._meanings_cache[hash_key] = tuple(meaning.model_copy() for meaning in result)
+                self._meanings_cache.move_to_end(hash_key)
+                # Evict the least recently used entry when the cache is full
+                if len(self._meanings_cache) > self._MEANINGS_CACHE_SIZE:
+                    self._meanings_cache.popitem(last=False)
             except Exception as cache_error:
                 self.logger.error(f"Error caching results: {str(cache_error)}")
             
@@ -802,6 +882,11 @@ class ReadingService:
             self.logger.error(f"Error extracting meanings from calculator result: {str(e)}", exc_info=True)
             return []
 
+    @classmethod
+    def clear_meanings_cache(cls) -> None:
+        """Drop cached meanings so they are rebuilt from the database on the next request"""
+        cls._meanings_cache.clear()
+
     def _generate_hash_key(self, calculator_result: BasesResult) -> str:
         """Generate a hash key for caching based on calculator result"""
         import hashlib
@@ -853,39 +938,34 @@ class ReadingService:
     def _filter_and_rank_meanings(self, meanings: List[Meaning], user_question: Optional[str] = None) -> List[Meaning]:
         """Filter and rank meanings more efficiently"""
         try:
-            # Start with all meanings
-            filtered_meanings = meanings.copy()
-            
             # If no question, return top 200 meanings by match score
             if not user_question:
-                filtered_meanings.sort(key=lambda m: m.match_score, reverse=True)
-                return filtered_meanings[:200]
+                return heapq.nlargest(200, meanings, key=lambda m: m.match_score)
+            
+            # The question only needs to be split once for all meanings
+            question_words = set(user_question.lower().split())
             
             # Calculate relevance scores based on question
-            for meaning in filtered_meanings:
+            for meaning in meanings:
                 # Base score from initial matching
                 score = meaning.match_score
                 
-                # Boost score based on question relevance
-                if user_question:
-                    # Check if question keywords appear in meaning
-                    question_words = set(user_question.lower().split())
-                    meaning_words = set(meaning.meaning.lower().split())
-                    heading_words = set(meaning.heading.lower().split())
-                    
-                    # Calculate word overlap
-                    meaning_overlap = len(question_words & meaning_words)
-                    heading_overlap = len(question_words & heading_words)
-                    
-                    # Boost score based on overlap
-                    score += meaning_overlap * 0.5  # Less weight for meaning overlap
-                    score += heading_overlap * 1.0  # More weight for heading overlap
+                # Check if question keywords appear in meaning
+                meaning_words = set(meaning.meaning.lower().split())
+                heading_words = set(meaning.heading.lower().split())
+                
+                # Calculate word overlap
+                meaning_overlap = len(question_words & meaning_words)
+                heading_overlap = len(question_words & heading_words)
+                
+                # Boost score based on overlap
+                score += meaning_overlap * 0.5  # Less weight for meaning overlap
+                score += heading_overlap * 1.0  # More weight for heading overlap
                 
                 meaning.match_score = score
             
-            # Sort by final score and return top 200
-            filtered_meanings.sort(key=lambda m: m.match_score, reverse=True)
-            return filtered_meanings[:200]
+            # Return top 200 by final score, leaving the caller's list order untouched
+            return heapq.nlargest(200, meanings, key=lambda m: m.match_score)
             
         except Exception as e:
             self.logger.error(f"Error in filtering meanings: {str(e)}", exc_info=True)
@@ -914,11 +994,14 @@ class ReadingService:
                     birth_date="",
                     thai_day=""
                 )
+            
+            # Format the birth date once for logging and every reading built below
+            birth_date_str = birth_date.strftime("%Y-%m-%d")
 
             # Calculate bases using calculator service
             try:
                 calculator_result = self.calculator_service.calculate_birth_bases(birth_date, thai_day)
-                self.logger.debug(f"Calculator result generated successfully: {birth_date.strftime('%Y-%m-%d')}")
+                self.logger.debug(f"Calculator result generated successfully: {birth_date_str}")
                 
                 # Verify that the calculator result has the expected structure
                 if not hasattr(calculator_result, 'bases') or not hasattr(calculator_result, 'birth_info'):
@@ -935,7 +1018,7 @@ class ReadingService:
                     heading="เกิดข้อผิดพลาดในการคำนวณ",
                     meaning=f"ขออภัย เกิดข้อผิดพลาดในการคำนวณ: {str(calc_error)}",
                     influence_type="ทั่วไป",
-                    birth_date=birth_date.strftime("%Y-%m-%d"),
+                    birth_date=birth_date_str,
                     thai_day=thai_day or ""
                 )
             
@@ -948,7 +1031,7 @@ class ReadingService:
                     heading="ไม่พบความหมาย",
                     meaning="ขออภัย ไม่พบความหมายที่เหมาะสม",
                     influence_type="ทั่วไป",
-                    birth_date=birth_date.strftime("%Y-%m-%d"),
+                    birth_date=birth_date_str,
                     thai_day=thai_day or getattr(calculator_result.birth_info, 'day', '')
                 )
                 
@@ -962,11 +1045,11 @@ class ReadingService:
                 return FortuneReading(
                     heading="ขออภัย ไม่พบการทำนายที่เหมาะสม",
                     meaning="ระบบไม่พบข้อมูลการทำนายที่ตรงกับคำถามของท่าน แต่สามารถคำนวณฐานเกิดของท่านได้ดังนี้:\n" + 
-                            f"วันเกิด: {birth_date.strftime('%Y-%m-%d')}\n" +
+                            f"วันเกิด: {birth_date_str}\n" +
                             f"วันพื้นดวง: {thai_day or getattr(calculator_result.birth_info, 'day', '')}\n" +
                             f"นักษัตร: {self._get_year_animal(birth_date.year)}",
                     influence_type="ทั่วไป",
-                    birth_date=birth_date.strftime("%Y-%m-%d"),
+                    birth_date=birth_date_str,
                     thai_day=thai_day or getattr(calculator_result.birth_info, 'day', ''),
                     question=user_question
                 )
@@ -1014,26 +1097,19 @@ class ReadingService:
                             f"ฐาน3 (ปีเกิด): {getattr(calculator_result.bases, 'base3', [])}\n" +
                             f"ฐาน4 (ผลรวม): {getattr(calculator_result.bases, 'base4', [])}"),
                     influence_type="ทั่วไป",
-                    birth_date=birth_date.strftime("%Y-%m-%d"),
+                    birth_date=birth_date_str,
                     thai_day=thai_day or getattr(calculator_result.birth_info, 'day', ''),
                     question=user_question
                 )
             
             # Get base and position information for additional context
-            base_names = ['วัน', 'เดือน', 'ปี', 'ผลรวม']
-            position_names = {
-                1: ['อัตตะ', 'หินะ', 'ธานัง', 'ปิตา', 'มาตา', 'โภคา', 'มัชฌิมา'],
-                2: ['ตะนุ', 'กดุมภะ', 'สหัชชะ', 'พันธุ', 'ปุตตะ', 'อริ', 'ปัตนิ'],
-                3: ['มรณะ', 'สุภะ', 'กัมมะ', 'ลาภะ', 'พยายะ', 'ทาสา', 'ทาสี']
-            }
-            
             base = getattr(selected_meaning, 'base', 0)
             position = getattr(selected_meaning, 'position', 0)
             
-            base_name = base_names[base - 1] if 0 < base <= 4 else f"ฐาน {base}"
+            base_name = BASE_NAMES[base - 1] if 0 < base <= 4 else f"ฐาน {base}"
             position_name = ""
             if base <= 3 and 0 < position <= 7:
-                position_name = position_names[base][position - 1]
+                position_name = THAI_POSITIONS[base][position - 1]
             
             # For debugging - log what we selected from DB
             self.logger.info(f"Selected meaning - Base: {base_name}, Position: {position_name}, Value: {getattr(selected_meaning, 'value', None)}")
@@ -1077,7 +1153,7 @@ class ReadingService:
                     heading=enhanced_heading,
                     meaning=getattr(selected_meaning, 'content', getattr(selected_meaning, 'meaning', '')),
                     influence_type=getattr(selected_meaning, 'category', 'ทั่วไป'),
-                    birth_date=birth_date.strftime("%Y-%m-%d"),
+                    birth_date=birth_date_str,
                     thai_day=thai_day or getattr(calculator_result.birth_info, 'day', ''),
                     question=user_question
                 )
@@ -1112,34 +1188,21 @@ class ReadingService:
         bases, user question, and a selected meaning.
         """
         try:
-            # Check if required modules exist before importing
-            import importlib.util
-            ai_spec = importlib.util.find_spec("app.services.ai")
-            prompt_spec = importlib.util.find_spec("app.services.prompt")
-            
-            if not ai_spec or not prompt_spec:
-                missing_modules = []
-                if not ai_spec:
-                    missing_modules.append("app.services.ai")
-                if not prompt_spec:
-                    missing_modules.append("app.services.prompt")
-                self.logger.warning(f"Required modules not found: {', '.join(missing_modules)}. Skipping AI reading generation.")
+            # Resolve the AI services once per process instead of on every reading
+            dependencies = _get_ai_reading_dependencies()
+            if dependencies is None:
+                self.logger.warning("Required AI modules not found. Skipping AI reading generation.")
                 return None
-                
-            # Safe imports after verifying modules exist
-            from app.services.prompt import PromptService
-            from app.services.openai_service import OpenAIService
+            PromptService, OpenAIService, MeaningService = dependencies
             
-            # Import here to avoid circular imports
             ai_service = OpenAIService()
             prompt_service = PromptService()
             
             # Create MeaningService if needed
             meaning_service = None
-            try:
-                from app.services.meaning import MeaningService
+            if MeaningService is not None:
                 meaning_service = MeaningService(self.category_repository, self.reading_repository)
-            except ImportError:
+            else:
                 self.logger.warning("MeaningService module not found, proceeding with limited functionality")
             
             # Get birth info and bases from calculator result
@@ -1223,12 +1286,7 @@ class ReadingService:
     
     def _get_year_animal(self, year: int) -> str:
         """Get Thai zodiac animal for a given year"""
-        animals = [
-            "ชวด (หนู)", "ฉลู (วัว)", "ขาล (เสือ)", "เถาะ (กระต่าย)", 
-            "มะโรง (งูใหญ่)", "มะเส็ง (งูเล็ก)", "มะเมีย (ม้า)", "มะแม (แพะ)", 
-            "วอก (ลิง)", "ระกา (ไก่)", "จอ (หมา)", "กุน (หมู)"
-        ]
-        return animals[(year - 4) % 12]
+        return YEAR_ANIMALS[(year - 4) % 12]
     
     def _determine_influence_type(
         self,
@@ -1249,15 +1307,12 @@ class ReadingService:
         """
         try:
             # First try to use the topic as influence type
-            if topic in ['การเงิน', 'ความรัก', 'สุขภาพ', 'การงาน', 'การศึกษา', 'ครอบครัว', 'โชคลาภ', 'อนาคต', 'การเดินทาง']:
+            if topic in STANDARD_INFLUENCE_TYPES:
                 return topic
                 
             # If topic is not a standard influence type, analyze the content
-            positive_keywords = ['ดี', 'เจริญ', 'รุ่งเรือง', 'สำเร็จ', 'โชคลาภ', 'มั่งมี', 'สมหวัง', 'สุข']
-            negative_keywords = ['ไม่ดี', 'ระวัง', 'อันตราย', 'เสีย', 'ยาก', 'ลำบาก', 'ทุกข์']
-            
-            positive_count = sum(1 for word in positive_keywords if word in meaning)
-            negative_count = sum(1 for word in negative_keywords if word in meaning)
+            positive_count = sum(1 for word in POSITIVE_INFLUENCE_KEYWORDS if word in meaning)
+            negative_count = sum(1 for word in NEGATIVE_INFLUENCE_KEYWORDS if word in meaning)
             
             if positive_count > negative_count:
                 return 'ดี'
@@ -1334,30 +1389,10 @@ class ReadingService:
                 # Return the best match after score adjustments
                 return max(meanings, key=lambda m: getattr(m, 'match_score', 0))
             
-            # Define related categories for each topic to improve matching
-            topic_related_categories = {
-                'การเงิน': ['หินะ', 'ทรัพย์', 'เงิน', 'ธุรกิจ', 'กดุมภะ', 'ลาภะ', 'โภคา', 'ธานัง'],
-                'ความรัก': ['มาตา', 'คู่ครอง', 'ความรัก', 'ปุตตะ', 'ปัตนิ', 'สหัชชะ'],
-                'สุขภาพ': ['โภคา', 'อัตตะ', 'ร่างกาย', 'สุขภาพ', 'ตะนุ', 'มรณะ'],
-                'การงาน': ['โภคา', 'กัมมะ', 'อาชีพ', 'หน้าที่', 'งาน', 'ทาสา', 'ทาสี'],
-                'การศึกษา': ['ธานัง', 'การเรียนรู้', 'วิชาการ', 'สหัชชะ', 'ปุตตะ'],
-                'ครอบครัว': ['ปิตา', 'มาตา', 'บ้าน', 'ครอบครัว', 'พันธุ', 'ปุตตะ'],
-                'โชคลาภ': ['ลาภะ', 'โชค', 'หินะ', 'ทรัพย์', 'สุภะ', 'กดุมภะ'],
-                'อนาคต': ['พยายะ', 'อนาคต', 'แนวโน้ม', 'ทิศทาง', 'ลาภะ'],
-                'การเดินทาง': ['ธานัง', 'สหัชชะ', 'เดินทาง', 'ย้ายถิ่น', 'สุภะ']
-            }
-            
-            # Default to general categories if topic not found
-            related_categories = topic_related_categories.get(primary_topic, ['กัมมะ', 'ลาภะ', 'สุภะ', 'อัตตะ'])
-            
-            # Get secondary topics for broader matching
-            secondary_topics = topic_result.secondary_topics
-            for secondary_topic in secondary_topics:
-                if secondary_topic in topic_related_categories:
-                    related_categories.extend(topic_related_categories[secondary_topic])
-            
-            # Make the list unique
-            related_categories = list(set(related_categories))
+            # Collect related categories for the primary and secondary topics
+            related_categories = set(TOPIC_RELATED_CATEGORIES.get(primary_topic, DEFAULT_RELATED_CATEGORIES))
+            for secondary_topic in topic_result.secondary_topics:
+                related_categories.update(TOPIC_RELATED_CATEGORIES.get(secondary_topic, ()))
             self.logger.debug(f"Related categories for topic matching: {', '.join(related_categories)}")
             
             # Initial scoring based on category matches
@@ -1369,12 +1404,10 @@ class ReadingService:
                 # Extract category from meaning
                 category = getattr(meaning, 'category', '')
                 
-                # Check for direct or partial category match
+                # Match any of the meaning's categories (combinations are joined with "-")
                 category_match_score = 0.0
-                for related_cat in related_categories:
-                    if category and related_cat.lower() in category.lower():
-                        category_match_score = 2.0
-                        break
+                if category and not related_categories.isdisjoint(category.lower().split("-")):
+                    category_match_score = 2.0
                 
                 # Check if this is a significant position based on base and value
                 position_score = self._calculate_match_score(
@@ -1437,22 +1470,8 @@ class ReadingService:
         try:
             self.logger.info(f"Generating local enhanced reading for topic: {topic}")
             
-            # Generate topic-specific heading
-            topic_headings = {
-                'การเงิน': "คำทำนายเรื่องการเงินและทรัพย์สิน",
-                'ความรัก': "คำทำนายเรื่องความรักและความสัมพันธ์",
-                'สุขภาพ': "คำทำนายเรื่องสุขภาพและความเป็นอยู่",
-                'การงาน': "คำทำนายเรื่องการงานและอาชีพ",
-                'การศึกษา': "คำทำนายเรื่องการศึกษาและการเรียนรู้",
-                'ครอบครัว': "คำทำนายเรื่องครอบครัวและบ้าน",
-                'โชคลาภ': "คำทำนายเรื่องโชคลาภและความสำเร็จ",
-                'อนาคต': "คำทำนายเรื่องอนาคตและชะตาชีวิต",
-                'การเดินทาง': "คำทำนายเรื่องการเดินทางและการย้ายถิ่น",
-                'ทั่วไป': "คำทำนายเรื่องทั่วไป"
-            }
-            
-            # Get heading based on topic
-            heading = topic_headings.get(topic, f"คำทำนายเรื่อง{topic}")
+            # Get topic-specific heading
+            heading = TOPIC_READING_HEADINGS.get(topic, f"คำทำนายเรื่อง{topic}")
             
             # Add confidence indication to heading if available
             if topic_result and topic_result.confidence > 7:
@@ -1463,65 +1482,40 @@ class ReadingService:
             
             # For general topic, check if the reading is overly focused on a specific area
             if topic == "ทั่วไป":
-                # Financial keywords to look for
-                financial_keywords = ['เงิน', 'ทอง', 'ทรัพย์', 'สมบัติ', 'ธุรกิจ', 'กำไร', 'รายได้', 'ลงทุน', 'การเงิน', 'ฐานะ']
-                
                 # Count financial keywords
-                financial_count = sum(1 for kw in financial_keywords if kw in raw_meaning.lower())
+                financial_count = sum(1 for kw in FINANCIAL_KEYWORDS if kw in raw_meaning.lower())
                 
                 # If the reading is heavily focused on finances but the topic is general, add balance
                 if financial_count >= 3 and len(raw_meaning.split()) >= 20:
                     self.logger.info("General topic with financial focus detected, adding balance")
                     
                     # Add balanced aspects of life to provide a more general reading
-                    additional_context = "\n\nนอกจากด้านการเงินแล้ว คุณยังมีโอกาสดีในด้านความสัมพันธ์และการพัฒนาตนเอง " \
-                        "คุณมีความสามารถในการสร้างความสัมพันธ์ที่ดีกับผู้คนรอบข้าง และมีแนวโน้มที่จะประสบความสำเร็จในสิ่งที่ตั้งใจทำ " \
-                        "ควรให้ความสำคัญกับการดูแลสุขภาพและครอบครัวควบคู่ไปกับการพัฒนาด้านการงานและการเงิน"
-                    
-                    # Append to the raw meaning
-                    raw_meaning += additional_context
+                    raw_meaning += GENERAL_BALANCE_CONTEXT
             
-            # Structure the meaning into paragraphs if it's not already
-            paragraphs = raw_meaning.split("\n")
-            if len(paragraphs) <= 1:
-                # If the meaning is just one paragraph, try to split by periods
+            # Structure the meaning into paragraphs if it's not already; text that already
+            # has line breaks or only one sentence is used as-is without splitting
+            body = raw_meaning
+            if "\n" not in raw_meaning and ". " in raw_meaning:
                 parts = raw_meaning.split(". ")
-                if len(parts) > 1:
-                    # Group parts into approximately 2-3 sentences per paragraph
-                    group_size = max(1, len(parts) // 3)
-                    new_paragraphs = []
-                    for i in range(0, len(parts), group_size):
-                        group = parts[i:i+group_size]
-                        # Add period back to the end of sentences except the last part
-                        for j in range(len(group) - 1):
-                            group[j] += "."
-                        # Last part might already have a period
-                        if not group[-1].endswith("."):
-                            group[-1] += "."
-                        new_paragraphs.append(" ".join(group))
-                    paragraphs = new_paragraphs
+                # Group parts into approximately 2-3 sentences per paragraph
+                group_size = max(1, len(parts) // 3)
+                new_paragraphs = []
+                for i in range(0, len(parts), group_size):
+                    # Add period back between sentences; the last part might already have one
+                    paragraph = ". ".join(parts[i:i+group_size])
+                    if not paragraph.endswith("."):
+                        paragraph += "."
+                    new_paragraphs.append(paragraph)
+                body = "\n".join(new_paragraphs)
             
             # Create introduction paragraph
             intro = f"จากการคำนวณฐาน{base_name} ตำแหน่ง{position_name} ของคุณ ทำนายได้ว่า:\n\n"
             
             # Add contextual paragraph at the end based on the topic
-            topic_context = {
-                'การเงิน': "ในด้านการเงิน คุณควรระมัดระวังการใช้จ่ายและวางแผนการเงินอย่างรอบคอบในช่วงนี้ การลงทุนควรพิจารณาอย่างรอบด้านและไม่ประมาท",
-                'ความรัก': "สำหรับความรัก การสื่อสารอย่างเปิดใจจะช่วยเสริมสร้างความเข้าใจและความสัมพันธ์ที่ดี ให้ความสำคัญกับความรู้สึกของคนรอบข้าง",
-                'สุขภาพ': "ด้านสุขภาพ ควรดูแลตัวเองอย่างสม่ำเสมอ ออกกำลังกายพอประมาณและพักผ่อนให้เพียงพอ หลีกเลี่ยงความเครียดสะสม",
-                'การงาน': "ในเรื่องการงาน ความขยันและความอดทนจะนำไปสู่ความสำเร็จ อย่ากลัวที่จะเรียนรู้สิ่งใหม่ๆและพัฒนาทักษะของตัวเอง",
-                'การศึกษา': "สำหรับการศึกษา ควรตั้งใจเรียนและแบ่งเวลาอย่างมีประสิทธิภาพ การทบทวนบทเรียนอย่างสม่ำเสมอจะช่วยให้เข้าใจเนื้อหาได้ดียิ่งขึ้น",
-                'ครอบครัว': "ในด้านครอบครัว ควรให้เวลากับคนในครอบครัวและรับฟังความคิดเห็นของทุกคน ความเข้าใจและการให้อภัยจะช่วยรักษาความสัมพันธ์ที่ดี",
-                'โชคลาภ': "สำหรับโชคลาภ โอกาสดีๆ อาจเข้ามาโดยไม่คาดคิด แต่อย่าหวังพึ่งโชคชะตาเพียงอย่างเดียว ความพยายามและความขยันเป็นสิ่งสำคัญ",
-                'อนาคต': "สำหรับอนาคต การวางแผนและเตรียมพร้อมรับมือกับการเปลี่ยนแปลงจะช่วยให้คุณก้าวไปข้างหน้าได้อย่างมั่นคง",
-                'การเดินทาง': "ในเรื่องการเดินทาง ควรวางแผนและเตรียมตัวให้พร้อม ศึกษาข้อมูลเส้นทางและสถานที่ให้ละเอียดเพื่อความปลอดภัยและความราบรื่น",
-                'ทั่วไป': "การสร้างสมดุลในชีวิตทั้งด้านการงาน การเงิน ความสัมพันธ์ และสุขภาพ จะนำมาซึ่งความสุขและความสำเร็จที่ยั่งยืน ใช้ชีวิตด้วยความไม่ประมาทและมีสติอยู่เสมอ"
-            }
-            
-            conclusion = f"\n\n{topic_context.get(topic, 'ขอให้คุณพบเจอแต่สิ่งดีๆ และมีความสุขในชีวิต')}"
+            conclusion = "\n\n" + TOPIC_READING_CONCLUSIONS.get(topic, DEFAULT_READING_CONCLUSION)
             
             # Build the complete meaning
-            meaning = intro + "\n".join(paragraphs) + conclusion
+            meaning = intro + body + conclusion
             
             # Determine influence type
             influence_type = self._determine_influence_type(meaning, topic, selected_meaning.category)
@@ -1587,25 +1581,27 @@ class ReadingService:
         return (heading, ai_content)
 
 
+# Shared instance for direct (non-DI) callers, so its caches persist across requests
+_reading_service: Optional[ReadingService] = None
+
+
 # Factory function for dependency injection
 async def get_reading_service(
     reading_repository: ReadingRepository = Depends(),
     category_repository: CategoryRepository = Depends()
 ) -> ReadingService:
-    """Get reading service instance when called from code or through dependency injection"""
+    """Get the shared reading service instance when called from code or through dependency injection"""
+    global _reading_service
+    if _reading_service is not None:
+        return _reading_service
+    
     # For direct calls outside of FastAPI's dependency injection system,
-    # we need to create new repository instances
+    # we need to create the repository instances ourselves
     try:
-        # If this is called directly (not through FastAPI's DI system)
-        # Just create new repositories directly
         from app.repository.reading_repository import get_reading_repository
         from app.repository.category_repository import get_category_repository
         
-        # Always create new repositories when called directly
-        direct_reading_repo = get_reading_repository()
-        direct_category_repo = get_category_repository()
-        
-        return ReadingService(direct_reading_repo, direct_category_repo)
+        _reading_service = ReadingService(get_reading_repository(), get_category_repository())
     except Exception as e:
         # Log the error but don't crash
         import logging
@@ -1619,4 +1615,6 @@ async def get_reading_service(
         reading_repo = ReadingRepository(Reading)
         category_repo = CategoryRepository(Category)
         
-        return ReadingService(reading_repo, category_repo)
\ No newline at end of file
+        _reading_service = ReadingService(reading_repo, category_repo)
+    
+    return _reading_service
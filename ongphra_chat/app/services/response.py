@@ -1,18 +1,115 @@
 # app/services/response.py
-from openai import AsyncOpenAI
 from typing import Dict, Optional, List, Any, AsyncGenerator, Tuple, Union
 import json
 import asyncio
 import time
 import os
+import re
+import calendar
 from datetime import datetime
 import random
+from functools import lru_cache
+from dataclasses import dataclass
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; fall back to the stdlib engine
+    re2 = None
 
 from app.core.exceptions import ResponseGenerationError
 from app.config.settings import get_settings
 from app.core.logging import get_logger
 from app.services.session_service import get_session_manager
 from app.services.reading_service import get_reading_service
+from app.services.ai_topic_service import get_ai_topic_service
+from app.services.ai import get_openai_client
+
+
+def _compile_dispatch_pattern(pattern: str):
+    """
+    Compile a dispatch pattern with RE2 when available
+
+    RE2 matches in linear time, so the keyword alternation cannot backtrack on
+    long messages. The stdlib engine is used if re2 is not installed or rejects
+    the pattern.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+# Keywords that mark a message as a fortune request
+FORTUNE_KEYWORDS = [
+    'ดวง', 'ดูดวง', 'ทำนาย', 'โหราศาสตร์', 'ชะตา', 'ไพ่ยิปซี', 'ราศี', 
+    'fortune', 'horoscope', 'predict', 'future', 'astrology', 'tarot',
+    'ฐานเกิด', 'เลขฐาน', 'วันเกิด'
+]
+FORTUNE_KEYWORD_PATTERN = _compile_dispatch_pattern(
+    "|".join(re.escape(keyword) for keyword in FORTUNE_KEYWORDS)
+)
+
+
+@lru_cache(maxsize=512)
+def _has_fortune_keyword(normalized_prompt: str) -> bool:
+    """
+    Check a normalized prompt for fortune keywords
+    
+    Memoized so retried or replayed messages skip the regex scan.
+    """
+    return FORTUNE_KEYWORD_PATTERN.search(normalized_prompt) is not None
+
+
+# DD/MM/YYYY or DD-MM-YYYY birth date in a message
+DATE_PATTERN = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})')
+
+# Detected topics that mark a message as a fortune request
+FORTUNE_TOPICS = frozenset(("ทั่วไป", "โชคลาภ", "อนาคต"))
+
+# Phrases whose answers depend on the current time, so responses are not cached
+TIME_SENSITIVE_PHRASES_ENGLISH = ("current time", "current date", "right now", "today", "yesterday", "tomorrow")
+TIME_SENSITIVE_PHRASES_THAI = ("เวลาปัจจุบัน", "วันที่ปัจจุบัน", "ตอนนี้", "วันนี้", "เมื่อวาน", "พรุ่งนี้")
+
+# Fixed user-facing messages, keyed by language
+BIRTHDATE_REQUEST_MESSAGES = {
+    "english": (
+        "To provide you with a fortune reading, I need to know your birth date. "
+        "Please provide your birth date in the format DD/MM/YYYY. "
+        "For example, if you were born on January 5, 1990, please type '5/1/1990'."
+    ),
+    "thai": (
+        "เพื่อให้ฉันสามารถดูดวงให้คุณได้ ฉันต้องการทราบวันเกิดของคุณ "
+        "กรุณาให้วันเกิดของคุณในรูปแบบ วัน/เดือน/ปี "
+        "ตัวอย่างเช่น หากคุณเกิดวันที่ 5 มกราคม 2533 กรุณาพิมพ์ '5/1/2533'"
+    ),
+}
+
+FORTUNE_ERROR_MESSAGES = {
+    "english": (
+        "I apologize, but I'm having trouble generating your fortune reading at the moment. "
+        "This could be due to a technical issue. "
+        "Please try again later or ask me a different question."
+    ),
+    "thai": (
+        "ขออภัย ฉันมีปัญหาในการดูดวงให้คุณในขณะนี้ "
+        "อาจเกิดจากปัญหาทางเทคนิค "
+        "โปรดลองอีกครั้งในภายหลัง หรือถามคำถามอื่น"
+    ),
+}
+
+RESPONSE_ERROR_MESSAGES = {
+    "english": "Sorry, an error occurred while generating the response. Please try again later.",
+    "thai": "ขออภัย เกิดข้อผิดพลาดในการตอบคำถาม โปรดลองอีกครั้งในภายหลัง",
+}
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Cached value with the time it was stored"""
+    value: Any
+    timestamp: float
+
 
 class LRUCache:
     """
@@ -40,7 +137,7 @@ class LRUCache:
         # Check for expiration
         item = self.cache[key]
         current_time = time.time()
-        if current_time - item["timestamp"] > self.ttl_seconds:
+        if current_time - item.timestamp > self.ttl_seconds:
             # Remove expired item
             self._remove_item(key)
             return None
@@ -48,7 +145,7 @@ class LRUCache:
         # Update access order
         self._update_access(key)
         
-        return item["value"]
+        return item.value
     
     def set(self, key, value):
         """Add item to cache, managing size limits"""
@@ -56,10 +153,7 @@ class LRUCache:
         
         # If key exists, update it
         if key in self.cache:
-            self.cache[key] = {
-                "value": value,
-                "timestamp": current_time
-            }
+            self.cache[key] = CacheEntry(value, current_time)
             self._update_access(key)
             return
             
@@ -68,10 +162,7 @@ class LRUCache:
             self._remove_lru()
             
         # Add new item
-        self.cache[key] = {
-            "value": value,
-            "timestamp": current_time
-        }
+        self.cache[key] = CacheEntry(value, current_time)
         self.access_order.append(key)
     
     def _update_access(self, key):
@@ -100,7 +191,7 @@ class LRUCache:
         current_time = time.time()
         expired_keys = [
             key for key, item in self.cache.items()
-            if current_time - item["timestamp"] > self.ttl_seconds
+            if current_time - item.timestamp > self.ttl_seconds
         ]
         
         for key in expired_keys:
@@ -128,8 +219,8 @@ class ResponseService:
         self.default_model = settings.default_model
         self.cache_ttl = settings.cache_ttl
         
-        # Initialize OpenAI client
-        self.client = AsyncOpenAI(api_key=self.openai_api_key)
+        # Use the shared OpenAI client
+        self.client = get_openai_client()
         
         # Initialize caches and memory
         self.response_cache = LRUCache(max_size=500, ttl_seconds=self.cache_ttl)
@@ -145,11 +236,12 @@ class ResponseService:
         
         self.logger.info(f"Initialized ResponseService with model {self.default_model}")
     
-    def _get_cache_key(self, prompt: str, language: str, model_name: str) -> str:
+    def _get_cache_key(self, prompt: str, language: str, model_name: str) -> Tuple[str, str, str]:
         """Generate a cache key from prompt, language and model"""
-        # Use first 100 chars of prompt to avoid excessive key size
+        # Use first 100 chars of prompt to avoid excessive key size; a tuple hashes
+        # its fields directly instead of building a joined string per lookup
         prompt_part = prompt[:100] if prompt else ""
-        return f"{prompt_part}_{language}_{model_name}"
+        return (prompt_part, language, model_name)
     
     def _should_use_cache(self, prompt: str) -> bool:
         """Determine if a prompt should use caching"""
@@ -157,13 +249,13 @@ class ResponseService:
         if not prompt or len(prompt) < 20:
             return False
             
-        # Skip cache for prompts that likely have changing context
-        skip_phrases = [
-            "current time", "current date", "right now", "today", "yesterday", "tomorrow",
-            "เวลาปัจจุบัน", "วันที่ปัจจุบัน", "ตอนนี้", "วันนี้", "เมื่อวาน", "พรุ่งนี้"
-        ]
+        # Skip cache for prompts that likely have changing context. Thai script has
+        # no case, so only the English phrases need the lowercased prompt.
+        if any(phrase in prompt for phrase in TIME_SENSITIVE_PHRASES_THAI):
+            return False
         
-        if any(phrase in prompt.lower() for phrase in skip_phrases):
+        prompt_lower = prompt.lower()
+        if any(phrase in prompt_lower for phrase in TIME_SENSITIVE_PHRASES_ENGLISH):
             return False
             
         return True
@@ -200,7 +292,8 @@ class ResponseService:
             except Exception as e:
                 self.logger.warning(f"Attempt {attempt+1}/{self.max_retries} failed: {str(e)}")
                 if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
+                    # Exponential backoff with jitter so concurrent failures don't retry in lockstep
+                    wait_time = self.retry_delay * (2 ** attempt) + random.uniform(0, 0.25)
                     self.logger.info(f"Retrying in {wait_time:.2f} seconds...")
                     await asyncio.sleep(wait_time)
                 else:
@@ -218,7 +311,7 @@ class ResponseService:
         Returns:
             A structured response with fortune reading information
         """
-        self.logger.info(f"Processing potential fortune request: '{prompt[:50]}...'")
+        self.logger.info("Processing potential fortune request: '%s...'", prompt[:50])
         
         # Initialize result dictionary
         result = {
@@ -236,24 +329,20 @@ class ResponseService:
             reading_service = await get_reading_service()
             
             # 1. Determine if this is a fortune request (moved from fortune_tool.py)
-            from app.services.ai_topic_service import get_ai_topic_service
             ai_topic_service = get_ai_topic_service()
             
-            # Check for fortune keywords (simplified from the original)
-            FORTUNE_KEYWORDS = [
-                'ดวง', 'ดูดวง', 'ทำนาย', 'โหราศาสตร์', 'ชะตา', 'ไพ่ยิปซี', 'ราศี', 
-                'fortune', 'horoscope', 'predict', 'future', 'astrology', 'tarot',
-                'ฐานเกิด', 'เลขฐาน', 'วันเกิด'
-            ]
+            # Normalize the message once; every check below reuses it
+            normalized_prompt = prompt.strip().lower()
+            topic_result = None
             
             # Simple detection - for comprehensive detection implement the multi-method approach from fortune_tool
-            is_fortune_request = any(keyword in prompt.lower() for keyword in FORTUNE_KEYWORDS)
+            is_fortune_request = _has_fortune_keyword(normalized_prompt)
             
             # Also check with the AI topic service if available
             try:
                 if ai_topic_service and not is_fortune_request:
                     topic_result = await ai_topic_service.detect_topic(prompt)
-                    if topic_result and topic_result.primary_topic in ["ทั่วไป", "โชคลาภ", "อนาคต"]:
+                    if topic_result and topic_result.primary_topic in FORTUNE_TOPICS:
                         is_fortune_request = True
             except Exception:
                 pass
@@ -268,16 +357,15 @@ class ResponseService:
             thai_day = None
             
             # Try to extract date from message (simplified - implement full extraction from fortune_tool if needed)
-            DATE_PATTERN = r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})'  # DD/MM/YYYY pattern
-            import re
-            date_match = re.search(DATE_PATTERN, prompt)
+            date_match = DATE_PATTERN.search(prompt)
             
             if date_match:
                 try:
                     day, month, year = int(date_match.group(1)), int(date_match.group(2)), int(date_match.group(3))
-                    if 1 <= day <= 31 and 1 <= month <= 12 and 1900 <= year <= 2100:
+                    # Validate with integer range checks before building the datetime
+                    if 1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
                         birth_date = datetime(year, month, day)
-                        result["extracted_birthdate"] = birth_date.strftime("%Y-%m-%d")
+                        result["extracted_birthdate"] = birth_date.date().isoformat()
                         session_manager.save_birth_info(user_id, birth_date, thai_day)
                 except (ValueError, IndexError):
                     pass
@@ -287,7 +375,8 @@ class ResponseService:
                 birth_info = session_manager.get_birth_info(user_id)
                 if birth_info:
                     try:
-                        birth_date = datetime.strptime(birth_info["birth_date"], "%Y-%m-%d")
+                        # Session dates are stored as YYYY-MM-DD, which fromisoformat parses directly
+                        birth_date = datetime.fromisoformat(birth_info["birth_date"])
                         thai_day = birth_info["thai_day"]
                     except (ValueError, KeyError):
                         pass
@@ -309,7 +398,9 @@ class ResponseService:
                 # Add topic information if available
                 if reading and ai_topic_service:
                     try:
-                        topic_result = await ai_topic_service.detect_topic(prompt)
+                        # Reuse the detection result from the fortune check when we have one
+                        if topic_result is None:
+                            topic_result = await ai_topic_service.detect_topic(prompt)
                         if topic_result:
                             reading.topic = topic_result.primary_topic
                             reading.confidence = topic_result.confidence
@@ -360,14 +451,14 @@ class ResponseService:
             if user_id:
                 session_manager = get_session_manager()
                 session_manager.save_conversation_message(user_id, "user", prompt)
-                self.logger.debug(f"Saved user message to session for user {user_id}")
+                self.logger.debug("Saved user message to session for user %s", user_id)
             
             # Process fortune detection first if enabled (use our direct method)
             fortune_result = None
             if process_fortune:
                 try:
                     fortune_result = await self.process_fortune_request(prompt, user_id)
-                    self.logger.debug(f"Fortune detection result: {fortune_result['is_fortune_request']}")
+                    self.logger.debug("Fortune detection result: %s", fortune_result["is_fortune_request"])
                     
                     if fortune_result["is_fortune_request"]:
                         self.logger.info("Detected fortune request, processing with fortune tool")
@@ -437,7 +528,7 @@ class ResponseService:
                     max_turns = int(os.getenv("MAX_CONVERSATION_TURNS", "10"))
                     recent_history = history[-max_turns*2:] if len(history) > max_turns*2 else history
                     messages.extend(recent_history)
-                    self.logger.debug(f"Added {len(recent_history)} messages from session history")
+                    self.logger.debug("Added %d messages from session history", len(recent_history))
             
             # Add current user message if not already in session
             if not user_id or (user_id and messages[-1]["role"] != "user"):
@@ -473,7 +564,7 @@ class ResponseService:
             return response
         except Exception as e:
             self.logger.error(f"Error generating response: {str(e)}", exc_info=True)
-            return "ขออภัย เกิดข้อผิดพลาดในการตอบคำถาม โปรดลองอีกครั้งในภายหลัง" if language.lower() == "thai" else "Sorry, an error occurred while generating the response. Please try again later."
+            return RESPONSE_ERROR_MESSAGES["thai" if language.lower() == "thai" else "english"]
         
     def _get_birthdate_request_message(self, language: str = "thai") -> str:
         """
@@ -485,18 +576,7 @@ class ResponseService:
         Returns:
             Formatted message requesting birthdate
         """
-        if language.lower() == "english":
-            return (
-                "To provide you with a fortune reading, I need to know your birth date. "
-                "Please provide your birth date in the format DD/MM/YYYY. "
-                "For example, if you were born on January 5, 1990, please type '5/1/1990'."
-            )
-        else:
-            return (
-                "เพื่อให้ฉันสามารถดูดวงให้คุณได้ ฉันต้องการทราบวันเกิดของคุณ "
-                "กรุณาให้วันเกิดของคุณในรูปแบบ วัน/เดือน/ปี "
-                "ตัวอย่างเช่น หากคุณเกิดวันที่ 5 มกราคม 2533 กรุณาพิมพ์ '5/1/2533'"
-            )
+        return BIRTHDATE_REQUEST_MESSAGES["english" if language.lower() == "english" else "thai"]
             
     def _format_fortune_reading(self, reading: Dict[str, Any], language: str = "thai") -> str:
         """
@@ -521,39 +601,39 @@ class ResponseService:
             thai_day = reading.get("thai_day", "")
             question = reading.get("question", "")
             
-            # Format response based on language
+            # Format response based on language, collecting parts and joining once
             if language.lower() == "english":
-                response = "🔮 **Fortune Reading** 🔮\n\n"
+                parts = ["🔮 **Fortune Reading** 🔮\n\n"]
                 
                 if heading:
-                    response += f"**Topic**: {heading}\n\n"
+                    parts.append(f"**Topic**: {heading}\n\n")
                     
                 if birth_date or thai_day:
-                    response += "**Birth Information**:\n"
+                    parts.append("**Birth Information**:\n")
                     if birth_date:
-                        response += f"Date: {birth_date}\n"
+                        parts.append(f"Date: {birth_date}\n")
                     if thai_day:
-                        response += f"Day: {thai_day}\n"
-                    response += "\n"
+                        parts.append(f"Day: {thai_day}\n")
+                    parts.append("\n")
                     
                 if meaning:
-                    response += f"**Reading**:\n{meaning}\n\n"
+                    parts.append(f"**Reading**:\n{meaning}\n\n")
                     
                 if influence_type:
-                    response += f"**Influence**: {influence_type}"
+                    parts.append(f"**Influence**: {influence_type}")
             else:
-                response = "🔮 **การดูดวง** 🔮\n\n"
+                parts = ["🔮 **การดูดวง** 🔮\n\n"]
                 
                 if heading:
-                    response += f"**หัวข้อ**: {heading}\n\n"
+                    parts.append(f"**หัวข้อ**: {heading}\n\n")
                     
                 if birth_date or thai_day:
-                    response += "**ข้อมูลวันเกิด**:\n"
+                    parts.append("**ข้อมูลวันเกิด**:\n")
                     if birth_date:
-                        response += f"วันที่: {birth_date}\n"
+                        parts.append(f"วันที่: {birth_date}\n")
                     if thai_day:
-                        response += f"วัน: {thai_day}\n"
-                    response += "\n"
+                        parts.append(f"วัน: {thai_day}\n")
+                    parts.append("\n")
                     
                 if meaning:
                     # Split meaning into paragraphs and format
@@ -566,11 +646,14 @@ class ResponseService:
                         if formatted_p:
                             formatted_paragraphs.append(formatted_p)
                     
-                    response += "**คำทำนาย**:\n" + "\n\n".join(formatted_paragraphs) + "\n\n"
+                    parts.append("**คำทำนาย**:\n")
+                    parts.append("\n\n".join(formatted_paragraphs))
+                    parts.append("\n\n")
                     
                 if influence_type:
-                    response += f"**ลักษณะ**: {influence_type}"
+                    parts.append(f"**ลักษณะ**: {influence_type}")
             
+            response = "".join(parts)
             return response
             
         except Exception as e:
@@ -587,18 +670,7 @@ class ResponseService:
         Returns:
             Formatted error message
         """
-        if language.lower() == "english":
-            return (
-                "I apologize, but I'm having trouble generating your fortune reading at the moment. "
-                "This could be due to a technical issue. "
-                "Please try again later or ask me a different question."
-            )
-        else:
-            return (
-                "ขออภัย ฉันมีปัญหาในการดูดวงให้คุณในขณะนี้ "
-                "อาจเกิดจากปัญหาทางเทคนิค "
-                "โปรดลองอีกครั้งในภายหลัง หรือถามคำถามอื่น"
-            )
+        return FORTUNE_ERROR_MESSAGES["english" if language.lower() == "english" else "thai"]
     
     async def _stream_text(self, text: str) -> AsyncGenerator[str, None]:
         """
@@ -629,7 +701,7 @@ class ResponseService:
             Generated response
         """
         try:
-            self.logger.debug(f"Generating response with {len(messages)} messages")
+            self.logger.debug("Generating response with %d messages", len(messages))
             response = await self.client.chat.completions.create(
                 model=self.default_model,
                 messages=messages,
@@ -638,7 +710,7 @@ class ResponseService:
             )
             
             response_text = response.choices[0].message.content.strip()
-            self.logger.debug(f"Generated response with {len(response_text)} characters")
+            self.logger.debug("Generated response with %d characters", len(response_text))
             return response_text
         except Exception as e:
             self.logger.error(f"Error in OpenAI API call: {str(e)}", exc_info=True)
@@ -660,7 +732,7 @@ class ResponseService:
             Chunks of the generated response
         """
         try:
-            self.logger.debug(f"Generating streaming response with {len(messages)} messages")
+            self.logger.debug("Generating streaming response with %d messages", len(messages))
             
             # Initialize the OpenAI streaming response
             stream = await self.client.chat.completions.create(
@@ -671,17 +743,19 @@ class ResponseService:
                 stream=True
             )
             
-            # Collect the full response for saving to session
-            full_response = ""
+            # Collect the chunks for saving the full response to session
+            response_parts = []
             
             # Stream the response chunks
             async for chunk in stream:
                 if hasattr(chunk.choices[0], "delta") and hasattr(chunk.choices[0].delta, "content"):
                     content = chunk.choices[0].delta.content
                     if content:
-                        full_response += content
+                        response_parts.append(content)
                         yield content
             
+            full_response = "".join(response_parts)
+            
             # Save the full response to session if user_id is provided
             if user_id and full_response:
                 # Save to conversation memory
@@ -694,20 +768,17 @@ class ResponseService:
                 # Save to session
                 session_manager = get_session_manager()
                 session_manager.save_conversation_message(user_id, "assistant", full_response)
-                self.logger.debug(f"Saved assistant streaming response to session for user {user_id}")
+                self.logger.debug("Saved assistant streaming response to session for user %s", user_id)
             
-            # Send the end of stream marker
-            yield "[DONE]"
+            # The end of stream marker is sent by the transport, not as part of the content
         except Exception as e:
             self.logger.error(f"Error in streaming response: {str(e)}", exc_info=True)
             yield f"ขออภัย เกิดข้อผิดพลาดในการสตรีมข้อความ: {str(e)}"
-            yield "[DONE]"
     
     def clear_user_conversation(self, user_id: str) -> bool:
         """Clear conversation history for a user"""
         # Clear from old conversation memory
-        if user_id in self.conversation_memory:
-            del self.conversation_memory[user_id]
+        if self.conversation_memory.pop(user_id, None) is not None:
             self.logger.info(f"Cleared conversation history for user {user_id} from memory")
         
         # Also clear from session manager
@@ -724,7 +795,7 @@ class ResponseService:
         self.logger.info(f"Cleared response cache ({count} items)")
         return count
 
-    def _cache_response(self, cache_key: str, response: str) -> None:
+    def _cache_response(self, cache_key: Tuple[str, str, str], response: str) -> None:
         """Cache a response with timestamp"""
         self.response_cache.set(cache_key, response)
         
@@ -732,6 +803,12 @@ class ResponseService:
         if random.random() < 0.01:
             self.response_cache.clean_expired()
 
-    def _get_cached_response(self, cache_key: str) -> Optional[str]:
+    def _get_cached_response(self, cache_key: Tuple[str, str, str]) -> Optional[str]:
         """Get a cached response if it exists and is not expired"""
-        return self.response_cache.get(cache_key)
\ No newline at end of file
+        return self.response_cache.get(cache_key)
+
+# Factory function for dependency injection
+@lru_cache()
+def get_response_service() -> ResponseService:
+    """Get response service instance, created on first use"""
+    return ResponseService()
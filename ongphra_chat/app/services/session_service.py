@@ -1,9 +1,10 @@
 from typing import Dict, List, Optional, Any
 import time
 from datetime import datetime, timedelta
-import json
 import threading
 
+import orjson
+
 from app.core.logging import get_logger
 
 
@@ -61,8 +62,9 @@ class SessionManager:
             self._cleanup_expired_sessions()
         
         # Get existing session or create a new one
-        if user_id not in self.sessions:
-            self.sessions[user_id] = {
+        session = self.sessions.get(user_id)
+        if session is None:
+            session = self.sessions[user_id] = {
                 "created_at": time.time(),
                 "last_updated": time.time(),
                 "conversation_history": [],
@@ -74,9 +76,9 @@ class SessionManager:
             self.logger.info(f"Created new session for user {user_id}")
         else:
             # Update last_updated timestamp
-            self.sessions[user_id]["last_updated"] = time.time()
+            session["last_updated"] = time.time()
         
-        return self.sessions[user_id]
+        return session
     
     def save_conversation_message(
         self, 
@@ -95,19 +97,20 @@ class SessionManager:
             max_history: Maximum number of messages to keep in history
         """
         session = self.get_session(user_id)
+        history = session["conversation_history"]
         
         # Add message to history
-        session["conversation_history"].append({
+        history.append({
             "role": role,
             "content": content,
             "timestamp": time.time()
         })
         
-        # Trim history if needed
-        if len(session["conversation_history"]) > max_history:
-            session["conversation_history"] = session["conversation_history"][-max_history:]
+        # Trim in place to the most recent max_history messages
+        if len(history) > max_history:
+            del history[:-max_history]
             
-        self.logger.debug(f"Saved {role} message for user {user_id}, history size: {len(session['conversation_history'])}")
+        self.logger.debug(f"Saved {role} message for user {user_id}, history size: {len(history)}")
     
     def get_conversation_history(
         self, 
@@ -257,8 +260,7 @@ class SessionManager:
         Returns:
             True if session was cleared, False if not found
         """
-        if user_id in self.sessions:
-            del self.sessions[user_id]
+        if self.sessions.pop(user_id, None) is not None:
             self.logger.info(f"Cleared session for user {user_id}")
             return True
         return False
@@ -294,9 +296,10 @@ class SessionManager:
         Returns:
             JSON string of session data or None if not found
         """
-        if user_id in self.sessions:
+        session = self.sessions.get(user_id)
+        if session is not None:
             try:
-                return json.dumps(self.sessions[user_id])
+                return orjson.dumps(session, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
             except Exception as e:
                 self.logger.error(f"Error exporting session for user {user_id}: {str(e)}")
                 return None
@@ -314,7 +317,7 @@ class SessionManager:
             True if successful, False otherwise
         """
         try:
-            self.sessions[user_id] = json.loads(session_data)
+            self.sessions[user_id] = orjson.loads(session_data)
             self.sessions[user_id]["last_updated"] = time.time()
             self.logger.info(f"Imported session for user {user_id}")
             return True
@@ -0,0 +1,91 @@
+# app/tests/run_all.py
+import argparse
+import asyncio
+import importlib
+import logging
+import sys
+import os
+import time
+from typing import Dict
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows; asyncio's loop is used instead
+    uvloop = None
+
+# Add parent directory to path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.config.database import DatabaseManager
+from app.core.logging import setup_logging, get_logger
+
+# Test scripts to run, as dotted module names. Each one exposes an async main()
+# that raises if any of its tests fail.
+TEST_MODULES = [
+    "app.tests.test_repositories",
+    "app.tests.test_fortune_flow",
+    "app.tests.test_ai_topic",
+    "app.tests.test_streaming",
+]
+
+# Setup logging
+setup_logging()
+logger = get_logger("run_all")
+
+async def run_test(module_name: str) -> bool:
+    """
+    Import a test script and run its main() in this interpreter
+
+    Running the scripts in-process avoids starting a new Python interpreter
+    (and re-importing the app) for every script.
+    """
+    start_time = time.perf_counter()
+    try:
+        module = importlib.import_module(module_name)
+        await module.main()
+        passed = True
+    except Exception as e:
+        # Each script's main() logs its own traceback before re-raising
+        logger.error(f"{module_name} failed with error: {str(e)}")
+        passed = False
+
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"{module_name} {'passed' if passed else 'failed'} in {elapsed:.2f}s")
+    return passed
+
+def quiet_passing_output() -> None:
+    """
+    Only let warnings and errors from the test scripts and the app through
+
+    Progress messages from passing scripts are dropped before they are formatted
+    or written, while failures are still reported in full.
+    """
+    for name in ["app"] + [module_name.rsplit(".", 1)[-1] for module_name in TEST_MODULES]:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+async def main(verbose: bool = False) -> int:
+    """Run all test scripts and return a process exit code"""
+    if not verbose:
+        quiet_passing_output()
+    
+    results: Dict[str, bool] = {}
+    try:
+        # The scripts do not share state and mostly wait on the database and APIs,
+        # so run them concurrently; run_test logs each one as soon as it finishes
+        outcomes = await asyncio.gather(*(run_test(module_name) for module_name in TEST_MODULES))
+        results = dict(zip(TEST_MODULES, outcomes))
+    finally:
+        # The scripts share one event loop and database pool, so close it once at the end
+        await DatabaseManager.close_pool()
+
+    failed = [name for name, passed in results.items() if not passed]
+    logger.info(f"{len(results) - len(failed)}/{len(results)} test scripts passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the app test scripts")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show all log output from the test scripts")
+    args = parser.parse_args()
+    
+    run = uvloop.run if uvloop is not None else asyncio.run
+    sys.exit(run(main(verbose=args.verbose)))
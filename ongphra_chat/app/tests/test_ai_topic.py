@@ -32,8 +32,10 @@ async def test_topic_detection():
         "ฉันควรจะย้ายบ้านในปีนี้ไหม"
     ]
     
-    for message in test_messages:
-        result = await ai_topic_service.detect_topic(message)
+    # Each detection is an independent request, so run them concurrently
+    results = await asyncio.gather(*(ai_topic_service.detect_topic(message) for message in test_messages))
+    
+    for message, result in zip(test_messages, results):
         logger.info(f"\nMessage: {message}")
         logger.info(f"Detected topic: {result['primary_topic']} with confidence {result['confidence']}")
         logger.info(f"Reasoning: {result['reasoning']}")
@@ -118,13 +120,21 @@ async def main():
     """Run all tests"""
     logger.info("Starting AI topic service tests...")
     
+    # Topic detection and fortune reading share no state, so run them concurrently
+    # and report each failure rather than letting the first one hide the other
+    results = await asyncio.gather(
+        test_topic_detection(),
+        test_fortune_reading_with_topic(),
+        return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, Exception)]
+    for error in errors:
+        logger.error(f"Test failed with error: {str(error)}", exc_info=error)
+    if errors:
+        # Each failure was logged above, so raise one summary instead of re-logging it
+        raise RuntimeError(f"{len(errors)} AI topic test(s) failed") from errors[0]
+    
     try:
-        # Test AI topic detection
-        await test_topic_detection()
-        
-        # Test fortune reading with topic detection
-        await test_fortune_reading_with_topic()
-        
         # Test topic caching
         await test_topic_caching()
         
@@ -10,9 +10,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")
 
 # Replace utility imports with direct service imports
 from app.services.response import ResponseService
-from app.services.reading_service import get_reading_service
+from app.services.reading_service import ReadingMatcher, get_reading_service
 from app.services.calculator import CalculatorService
 from app.core.logging import setup_logging, get_logger
+from app.domain.meaning import Reading
 
 # Setup logging
 setup_logging()
@@ -94,6 +95,26 @@ async def test_calculator_service():
     
     return bases_result
 
+async def test_heading_base_priority():
+    """Test that an explicit base name in a heading wins over a base word"""
+    logger.info("Testing heading base name priority...")
+    
+    matcher = ReadingMatcher(logger)
+    
+    # Heading -> expected base; the first two mention วัน (base 1) before the explicit name
+    cases = {
+        "วันเกิด ฐาน2": 2,
+        "วันเกิด ผลรวม": 4,
+        "ปี เดือน": 2,
+        "ฐาน3": 3,
+    }
+    for heading, expected_base in cases.items():
+        reading = Reading(id=1, combination_id=1, heading=heading, meaning="", influence_type="ดี")
+        base, _, _ = matcher.extract_attributes_from_heading(reading)
+        assert base == expected_base, f"Heading '{heading}' resolved to base {base}, expected {expected_base}"
+    
+    logger.info("Heading base priority test passed ✓")
+
 async def test_reading_service():
     """Test the reading service directly"""
     logger.info("Testing reading service...")
@@ -175,17 +196,21 @@ async def main():
         # Test 3: Calculator service
         calculator_result = await test_calculator_service()
         
-        # Test 4: Reading service
+        # Test 4: Heading base name priority
+        await test_heading_base_priority()
+        
+        # Test 5: Reading service
         reading_result = await test_reading_service()
         
-        # Test 5: Complete response service flow
+        # Test 6: Complete response service flow
         response_flow_result = await test_response_service_fortune_flow()
         
         logger.info("All tests completed successfully!")
         
     except Exception as e:
         logger.error(f"Test failed with error: {str(e)}", exc_info=True)
-        
+        raise
+    
     logger.info("Fortune system tests completed.")
 
 if __name__ == "__main__":
@@ -69,7 +69,8 @@ async def main():
         
     except Exception as e:
         logger.error(f"Test failed with error: {str(e)}", exc_info=True)
-        
+        raise
+    
     logger.info("Repository tests completed.")
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+# app/tests/test_streaming.py
+import asyncio
+import logging
+import sys
+import os
+from contextlib import aclosing
+
+# Add parent directory to path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.routers.api_router import _batch_chunks, _bounded_stream
+from app.routers import api_router
+from app.core.logging import setup_logging, get_logger
+
+# Setup logging
+setup_logging()
+logger = get_logger("test_streaming")
+
+class _RecordingHandler(logging.Handler):
+    """Collect the log records emitted while a test runs"""
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+async def test_full_stream():
+    """Test that every chunk is relayed in order"""
+    logger.info("Testing full stream relay...")
+
+    async def source():
+        for i in range(2000):
+            yield f"{i},"
+
+    async with aclosing(_batch_chunks(_bounded_stream(source()))) as chunks:
+        result = "".join([chunk async for chunk in chunks])
+
+    assert result == "".join(f"{i}," for i in range(2000)), "Streamed chunks were lost or reordered"
+    logger.info("Full stream test passed ✓")
+
+async def test_early_close():
+    """Test that closing the batcher early closes the source without a lag warning"""
+    logger.info("Testing early close of the stream chain...")
+
+    source_closed = asyncio.Event()
+
+    async def source():
+        try:
+            for i in range(100000):
+                yield f"chunk {i}"
+                await asyncio.sleep(0.001)
+        finally:
+            source_closed.set()
+
+    handler = _RecordingHandler()
+    api_router.logger.addHandler(handler)
+    try:
+        # Stop after the first chunk, as a disconnected client would
+        async with aclosing(_batch_chunks(_bounded_stream(source(), put_timeout=0.5))) as chunks:
+            async for _ in chunks:
+                break
+
+        assert source_closed.is_set(), "Source stream was not closed with the batcher"
+
+        # Wait past the put timeout to catch a producer that is still running
+        await asyncio.sleep(1.0)
+    finally:
+        api_router.logger.removeHandler(handler)
+
+    lag_warnings = [record for record in handler.records if "lagging" in record.getMessage()]
+    assert not lag_warnings, "Producer kept running after the stream was closed"
+    logger.info("Early close test passed ✓")
+
+async def main():
+    """Run all tests"""
+    logger.info("Starting streaming tests...")
+
+    try:
+        await test_full_stream()
+        await test_early_close()
+
+        logger.info("All streaming tests completed successfully!")
+
+    except Exception as e:
+        logger.error(f"Test failed with error: {str(e)}", exc_info=True)
+        raise
+
+    logger.info("Streaming tests completed.")
+
+if __name__ == "__main__":
+    asyncio.run(main())
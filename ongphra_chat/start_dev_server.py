@@ -44,17 +44,28 @@ def start_dev_server():
         host = os.environ.get("HOST", "0.0.0.0")
         port = int(os.environ.get("PORT", "8000"))
         
-        print(f"Starting development server on {host}:{port}...")
+        # Auto-reload runs the app in a second Python process under a file watcher.
+        # RELOAD=false serves the app from this process instead, skipping that start-up.
+        reload = os.environ.get("RELOAD", "true").lower() == "true"
+        
+        print(f"Starting development server on {host}:{port}{'' if reload else ' without auto-reload'}...")
         print(f"API documentation available at http://{host if host != '0.0.0.0' else 'localhost'}:{port}/docs")
         
+        if reload:
+            app = "app.main:app"     # Reload needs an import string so the worker can re-import it
+        else:
+            from app.main import app
+        
         # Start uvicorn with development settings
         uvicorn.run(
-            "app.main:app",
+            app,
             host=host,
             port=port,
-            reload=True,             # Enable auto-reload for development
+            reload=reload,           # Enable auto-reload for development
             reload_delay=1,          # Reduce the delay between reload checks
             workers=1,               # Use a single worker for development
+            loop="auto",             # uvloop when installed; falls back to asyncio on Windows
+            http="httptools",        # C parser for HTTP/1.1
             log_level=os.environ.get("LOG_LEVEL", "debug").lower()
         )
     except Exception as e:
@@ -93,6 +93,8 @@ def start_server():
             port=port,
             reload=False,     # Disable auto-reload in production
             workers=worker_count,
+            loop="auto",      # uvloop when installed; falls back to asyncio on Windows
+            http="httptools", # C parser for HTTP/1.1
             log_level=os.environ.get("LOG_LEVEL", "info").lower(),
             access_log=False, # Disable access logs to reduce noise
             log_config=None   # Let our app configure logging instead of Uvicorn